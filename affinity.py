@@ -0,0 +1,19 @@
+"""
+Affinity Module
+CPU pinning for the bot process, importable without the telegram stack
+"""
+
+import os
+import logging
+
+def pin_process_cpu():
+    """Pin the process to the CPU named by BOT_CPU, if set (Linux only)"""
+    cpu = os.environ.get("BOT_CPU")
+    if cpu is None or not hasattr(os, "sched_setaffinity"):
+        return
+    try:
+        os.sched_setaffinity(0, {int(cpu)})
+    except (ValueError, OSError) as e:
+        logging.getLogger(__name__).warning("Could not pin to CPU %s: %s", cpu, e)
+        return
+    logging.getLogger(__name__).info("Pinned to CPU %s", cpu)
@@ -3,62 +3,603 @@ Bot Handler Module
 Handles all bot commands and chat member updates
 """
 
+import os
+import re
 import json
+import functools
+import importlib.util
+from itertools import islice
+import time
+import asyncio
 import logging
 from datetime import datetime
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
-from telegram.ext import ContextTypes, CallbackQueryHandler
+from telegram.ext import Application, ContextTypes, CommandHandler, CallbackQueryHandler, ChatMemberHandler, MessageHandler, filters
+from telegram.request import HTTPXRequest
+from telegram.error import TelegramError
 from channel_monitor import ChannelMonitor
 from admin_manager import AdminManager
 from messages import Messages
 from logger import BotLogger
+from cache import TTLCache
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional; the stdlib event loop works the same, just slower
+    uvloop = None
+
+CONFIG_FILE = 'config.json'
+CONFIG_JOURNAL = 'config.journal'  # append-only log of mutations since the last full write
+JOURNAL_COMPACT_THRESHOLD = 200  # entries; past this the journal is folded into config.json
+CONFIG_FLUSH_DELAY = 0.5  # seconds; coalesces bursts of config mutations into one write
+CHAT_INFO_TTL = 300  # seconds to reuse get_chat results (titles rarely change)
+CHAT_MEMBER_TTL = 60  # seconds to reuse get_chat_member results
+CHAT_ADMINS_TTL = 60  # seconds to reuse get_chat_administrators results
+CHAT_CACHE_SIZE = 4096  # max entries per lookup cache; least recently used are evicted first
+MONITORED_CHAT_TYPES = frozenset(('channel', 'supergroup'))
+BAN_PRE_STATES = frozenset(('member', 'restricted'))  # statuses a ban transition starts from
+ADMIN_STATES = frozenset(('creator', 'administrator'))
+BAN_WORKER_COUNT = 4  # background workers enforcing admin bans, sharded by chat ID
+SEND_WORKER_COUNT = 4  # background workers sending queued replies, sharded by chat ID
+WORKER_DRAIN_TIMEOUT = 10  # seconds to wait for queued work to finish at shutdown
+SEND_RATE_LIMIT = 30  # messages per second; Telegram's bot-wide cap
+API_CONCURRENCY = 20  # max lookup calls in flight at once, so gathers can't trip flood limits
+TEXT_INPUT_FILTER = filters.UpdateType.MESSAGE & filters.TEXT & ~filters.COMMAND  # ID input replies; built once
+
+# HTTP connection pools, overridable under "http_settings" in config.json
+DEFAULT_HTTP_SETTINGS = {
+    "connection_pool_size": 32,  # outbound API calls (lookups, replies, bans)
+    "get_updates_pool_size": 4,  # long polling gets its own pool so it can't starve outbound calls
+    "pool_timeout": 30,  # seconds to wait for a free connection before failing
+}
+
+SEND_CHANNEL_ID_PROMPT = (
+    "🆔 أرسل ID القناة الآن:\n\n"
+    "مثال: -1001234567890\n\n"
+    "ملاحظة: أرسل ID القناة كرسالة منفصلة (ليس كرد على هذه الرسالة)"
+)
+
+SEND_ADMIN_ID_PROMPT = (
+    "🆔 أرسل ID المشرف الآن:\n\n"
+    "مثال: 123456789\n\n"
+    "ملاحظة: أرسل ID المشرف كرسالة منفصلة (ليس كرد على هذه الرسالة)"
+)
+
+INVALID_CHANNEL_ID_ERROR = (
+    "❌ معرف القناة غير صحيح\n"
+    "يجب أن يكون رقم صحيح مثل: -1001234567890"
+)
+
+INVALID_ADMIN_ID_ERROR = (
+    "❌ معرف المشرف غير صحيح\n"
+    "يجب أن يكون رقم صحيح مثل: 123456789"
+)
+
+ADD_CHANNEL_USAGE = (
+    "📝 الاستخدام: /add_channel [ID_القناة]\n\n"
+    "مثال:\n/add_channel -1001234567890\n\n"
+    "📋 طريقة الحصول على ID القناة:\n"
+    "• استخدم @userinfobot في القناة\n"
+    "• أو استخدم @getidsbot مع اسم المستخدم\n"
+    "• أو انسخ رابط القناة واستخرج الID منه"
+)
+
+ADD_CHANNEL_INVALID_ID_ERROR = (
+    "❌ معرف القناة غير صحيح\n"
+    "📝 الاستخدام: /add_channel [ID_القناة]\n"
+    "مثال: /add_channel -1001234567890"
+)
+
+NOT_CHANNEL_ADMIN_ERROR = "❌ يجب أن تكون مالك القناة أو مشرف لإضافتها للحماية"
+
+NO_PROTECTED_CHANNELS_ERROR = "❌ لا توجد قنوات محمية. أضف قناة أولاً."
+
+# Known promote_chat_member failures -> (promotion_result, status_note); one regex pass classifies the error
+PROMOTE_ERROR_RE = re.compile(r"Right_forbidden|CHAT_ADMIN_REQUIRED|USER_NOT_PARTICIPANT|USER_ID_INVALID")
+PROMOTE_RIGHTS_ERROR = (
+    (
+        "\n❌ فشل في ترقيته لمشرف تلقائياً!"
+        "\n🔧 المشكلة: البوت لا يملك صلاحية ترقية الأعضاء"
+        "\n\n📋 الحل المطلوب:"
+        "\n1️⃣ اذهب لإعدادات القناة"
+        "\n2️⃣ ادخل على 'المشرفين'"
+        "\n3️⃣ ابحث عن البوت واضغط عليه"
+        "\n4️⃣ فعل صلاحية 'إضافة مشرفين جدد'"
+        "\n\n⚡ بديل سريع: رقي المستخدم يدوياً لمشرف، والبوت سيراقبه فوراً"
+    ),
+    "⚠️ يحتاج ترقية يدوية"
+)
+PROMOTE_ERRORS = {
+    "Right_forbidden": PROMOTE_RIGHTS_ERROR,
+    "CHAT_ADMIN_REQUIRED": PROMOTE_RIGHTS_ERROR,
+    "USER_NOT_PARTICIPANT": (
+        "\n❌ فشل في الترقية: المستخدم ليس عضو في القناة!"
+        "\n💡 الحل: يجب على المستخدم الانضمام للقناة أولاً",
+        "⚠️ المستخدم غير منضم للقناة"
+    ),
+    "USER_ID_INVALID": (
+        "\n❌ فشل في الترقية: الـ ID المُدخل غير صحيح!"
+        "\n💡 الحل: تأكد من الـ ID باستخدام @GetChatID_IL_BOT",
+        "❌ ID غير صحيح"
+    ),
+}
+
+# Static keyboards are never mutated, so one shared instance serves every reply
+BACK_TO_MAIN_BUTTON = InlineKeyboardButton("🏠 العودة للقائمة الرئيسية", callback_data="main_menu")
+
+BACK_TO_MAIN_MARKUP = InlineKeyboardMarkup([
+    [BACK_TO_MAIN_BUTTON]
+])
+
+# Main menu for users who don't own a protected channel yet
+ADD_CHANNEL_ONLY_MARKUP = InlineKeyboardMarkup([
+    [InlineKeyboardButton("🛡️ إضافة قناة للحماية", callback_data="add_channel")]
+])
+
+ADD_NEW_CHANNEL_BUTTON = InlineKeyboardButton("🛡️ إضافة قناة جديدة للحماية", callback_data="add_channel")
+
+ADD_CHANNEL_MARKUP = InlineKeyboardMarkup([
+    [InlineKeyboardButton("📝 إدخال ID القناة", callback_data="input_channel_id")],
+    [BACK_TO_MAIN_BUTTON]
+])
+
+ADD_ADMIN_MARKUP = InlineKeyboardMarkup([
+    [InlineKeyboardButton("📝 إدخال ID المشرف", callback_data="input_admin_id")],
+    [BACK_TO_MAIN_BUTTON]
+])
+
+# Monitored admin status -> (icon, label) for the status report
+STATUS_DISPLAY = {
+    'creator': ("👑", "مالك القناة"),
+    'administrator': ("👤", "مشرف فعال"),
+    'member': ("⚠️", "عضو عادي (ليس مشرف)"),
+    'left': ("❌", "غادر القناة"),
+    'kicked': ("🚫", "محظور"),
+}
+
+ADD_ADMIN_TO_CHANNEL_INSTRUCTIONS = (
+    "📋 لإضافة مشرف للمراقبة:\n"
+    "• احصل على معرف المشرف (User ID)\n"
+    "• تأكد من أن المشرف موجود في هذه القناة\n"
+    "• اضغط على 'إدخال ID المشرف' وأرسل المعرف\n\n"
+    "💡 طرق الحصول على معرف المشرف:\n"
+    "• استخدم @userinfobot\n"
+    "• أو استخدم @getidsbot\n"
+    "• أو ابحث في إعدادات التيليجرام"
+)
+
+def install_event_loop_policy():
+    """Use uvloop for every event loop created from here on, when it is installed"""
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logging.getLogger(__name__).info("Using uvloop event loop")
+
+def create_http_request(pool_size, pool_timeout):
+    """Build an HTTP transport with a connection pool of the given size"""
+    # HTTP/2 multiplexes requests over one connection but needs the optional h2 package
+    http_version = '2' if importlib.util.find_spec('h2') is not None else '1.1'
+    return HTTPXRequest(
+        connection_pool_size=pool_size,
+        pool_timeout=pool_timeout,
+        http_version=http_version
+    )
+
+def require_user_chat_message(handler):
+    """Skip updates that lack a user, chat or message before the handler runs"""
+    @functools.wraps(handler)
+    async def wrapper(self, update, context):
+        if not update.effective_user or not update.effective_chat or not update.message:
+            return
+        return await handler(self, update, context)
+    return wrapper
+
+def parse_telegram_id(text):
+    """Parse a (possibly negative) numeric Telegram ID, returning None for anything else"""
+    digits = text.removeprefix('-')
+    if not digits.isdecimal():
+        return None
+    return int(text)
+
+def dump_config(config):
+    """Serialize the config to UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(config, ensure_ascii=False, indent=2).encode('utf-8')
+
+def dump_journal_entry(entry):
+    """Serialize one journal entry as a JSON line"""
+    if orjson is not None:
+        return orjson.dumps(entry) + b'\n'
+    return json.dumps(entry).encode('utf-8') + b'\n'
+
+def parse_config(data):
+    """Parse config JSON from bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 class BotHandler:
+    # Fixed attribute set; keep in sync when adding state in __init__ or load_config
+    __slots__ = (
+        'logger', 'bot_logger', 'channel_monitor', 'admin_manager', 'messages', 'config',
+        '_config_dirty', '_config_flush_task', '_journal_pending', '_journal_length', '_replaying_journal',
+        '_generation',
+        '_chat_info_cache', '_chat_member_cache', '_chat_admins_cache', '_ban_queues', '_ban_workers',
+        '_send_queues', '_send_workers', '_send_tokens', '_send_refilled_at',
+        '_protected_channels', '_monitored', '_button_handlers', '_prefix_handlers', '_msg_cache', '_api_sem',
+    )
+    
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.bot_logger = BotLogger()
         self.channel_monitor = ChannelMonitor()
         self.admin_manager = AdminManager()
         self.messages = Messages()
+        self._config_dirty = False
+        self._config_flush_task = None
+        self._journal_pending = []  # (op, channel_id, admin_id) entries not yet on disk
+        self._journal_length = 0
+        self._replaying_journal = False
+        self._generation = 0  # generation of the config.json snapshot on disk
+        self._chat_info_cache = TTLCache(CHAT_CACHE_SIZE, CHAT_INFO_TTL)  # chat_id -> Chat
+        self._chat_member_cache = TTLCache(CHAT_CACHE_SIZE, CHAT_MEMBER_TTL)  # (chat_id, user_id) -> ChatMember
+        self._chat_admins_cache = TTLCache(CHAT_CACHE_SIZE, CHAT_ADMINS_TTL)  # chat_id -> tuple of ChatMember
+        self._ban_queues = None  # created on first use, inside the running event loop
+        self._ban_workers = []
+        self._send_queues = None  # created on first use, inside the running event loop
+        self._send_workers = []
+        self._send_tokens = SEND_RATE_LIMIT
+        self._send_refilled_at = 0.0
+        self._api_sem = asyncio.Semaphore(API_CONCURRENCY)
         self.load_config()
+        
+        # Inline button dispatch: exact callback_data first, then "<prefix>_<id>" buttons
+        # whose handlers receive the parsed ID
+        self._button_handlers = {
+            "add_channel": self._cb_add_channel,
+            "input_channel_id": self._cb_input_channel_id,
+            "add_admin": self._cb_add_admin,
+            "input_admin_id": self._cb_input_admin_id,
+            "main_menu": self.show_main_menu,
+        }
+        self._prefix_handlers = {
+            "add_admin_to_channel_": self._cb_add_admin_to_channel,
+            "remove_channel_": self._cb_remove_channel,
+            "remove_admin_": self._cb_remove_admin,
+            "show_channel_admins_": self.show_channel_admins,
+            "show_monitored_status_": self.show_monitored_status,
+        }
+        
+        # Pre-render every message that takes no parameters
+        self._msg_cache = {
+            key: self.messages.get_message(key)
+            for key, template in self.messages.messages['ar'].items()
+            if '{' not in template
+        }
+    
+    @property
+    def protected_channels(self):
+        """Set of protected channel IDs (self.config stays the source of truth on save)"""
+        return self._protected_channels
+    
+    @property
+    def monitored_admins(self):
+        """Set of admin IDs monitored in at least one channel"""
+        return set().union(*self._monitored.values())
+    
+    @property
+    def auto_ban_enabled(self):
+        """Whether bans by monitored admins are acted on automatically"""
+        return self.config["channel_settings"].get("auto_ban_enabled", True)
     
     def load_config(self):
         """Load bot configuration from JSON file"""
         try:
-            with open('config.json', 'r', encoding='utf-8') as f:
-                self.config = json.load(f)
+            with open(CONFIG_FILE, 'rb') as f:
+                self.config = parse_config(f.read())
         except FileNotFoundError:
             self.logger.error("Config file not found, using defaults")
             self.config = {
                 "bot_settings": {"language": "ar"},
                 "channel_settings": {"auto_ban_enabled": True}
             }
+        
+        # Action logging can be switched off in config; checked once here, not per call
+        self.bot_logger.enabled = self.config.get("bot_settings", {}).get("action_logging", True)
+        
+        # Set mirror of protected_channels for O(1) membership tests on every update
+        settings = self.config["channel_settings"]
+        self._protected_channels = set(settings.get("protected_channels", []))
+        
+        # Per-channel index of monitored admins: channel_id -> set of admin IDs
+        by_channel = settings.get("monitored_admins_by_channel")
+        if by_channel is None:
+            # Older configs only have the flat list; treat it as monitored everywhere
+            flat = settings.get("monitored_admins", [])
+            by_channel = {channel_id: flat for channel_id in self._protected_channels} if flat else {}
+        self._monitored = {int(channel_id): set(admins) for channel_id, admins in by_channel.items() if admins}
+        
+        self._generation = self.config.get("journal_generation", 0)
+        self._replay_journal()
+    
+    def _replay_journal(self):
+        """Apply mutations journaled since the last full write, then compact"""
+        try:
+            with open(CONFIG_JOURNAL, 'rb') as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return
+        
+        self._replaying_journal = True
+        try:
+            for line in lines:
+                try:
+                    entry = parse_config(line)
+                    op, channel_id, admin_id = entry[:3]
+                except ValueError:
+                    # A torn final line from an interrupted append; everything before it is intact
+                    self.logger.warning("Skipping malformed config journal entry: %r", line)
+                    continue
+                # Entries stamped at or below the snapshot's generation are already in it; they
+                # survive when a crash lands between writing the snapshot and removing the journal
+                if len(entry) > 3 and entry[3] <= self._generation:
+                    continue
+                self._apply_journal_entry(op, channel_id, admin_id)
+        finally:
+            self._replaying_journal = False
+        
+        self.save_config()
+    
+    def _apply_journal_entry(self, op, channel_id, admin_id):
+        """Re-apply a single journaled mutation to the in-memory config"""
+        if op == "protect":
+            self._add_protected_channel(channel_id)
+        elif op == "unprotect":
+            self._remove_protected_channel(channel_id)
+        elif op == "monitor":
+            self._add_monitored_admin(channel_id, admin_id)
+        elif op == "unmonitor":
+            self._remove_monitored_admin(admin_id, channel_id)
+    
+    def _journal(self, op, channel_id, admin_id=None):
+        """Record a config mutation and schedule it to be persisted"""
+        if self._replaying_journal:
+            return
+        self._journal_pending.append((op, channel_id, admin_id))
+        self._mark_dirty()
+    
+    def get_http_settings(self):
+        """Return HTTP pool settings from the config, filled in with defaults"""
+        return {**DEFAULT_HTTP_SETTINGS, **self.config.get("http_settings", {})}
+    
+    def create_requests(self):
+        """Build the (outbound, get_updates) HTTP transports for the Application builder"""
+        settings = self.get_http_settings()
+        return (
+            create_http_request(settings["connection_pool_size"], settings["pool_timeout"]),
+            create_http_request(settings["get_updates_pool_size"], settings["pool_timeout"])
+        )
+    
+    def _add_protected_channel(self, channel_id):
+        """Add a channel to the protected list; returns False if already protected"""
+        if channel_id in self._protected_channels:
+            return False
+        self._protected_channels.add(channel_id)
+        self._sync_protected_config()
+        self._journal("protect", channel_id)
+        return True
+    
+    def _remove_protected_channel(self, channel_id):
+        """Remove a channel and its monitored admins; returns False if it was not protected"""
+        if channel_id not in self._protected_channels:
+            return False
+        self._protected_channels.discard(channel_id)
+        self._sync_protected_config()
+        if self._monitored.pop(channel_id, None) is not None:
+            self._sync_monitored_config()
+        self._journal("unprotect", channel_id)
+        return True
+    
+    def _add_monitored_admin(self, channel_id, admin_id):
+        """Start monitoring an admin in a channel; returns False if already monitored there"""
+        admins = self._monitored.setdefault(channel_id, set())
+        if admin_id in admins:
+            return False
+        admins.add(admin_id)
+        self._sync_monitored_config()
+        self._journal("monitor", channel_id, admin_id)
+        return True
+    
+    def _remove_monitored_admin(self, admin_id, channel_id=None):
+        """Stop monitoring an admin in one channel, or in every channel when channel_id is None"""
+        channel_ids = list(self._monitored) if channel_id is None else [channel_id]
+        removed = False
+        for cid in channel_ids:
+            admins = self._monitored.get(cid)
+            if admins and admin_id in admins:
+                admins.discard(admin_id)
+                if not admins:
+                    del self._monitored[cid]
+                self._journal("unmonitor", cid, admin_id)
+                removed = True
+        if removed:
+            self._sync_monitored_config()
+        return removed
+    
+    def _sync_protected_config(self):
+        """Write the protected set back to the config as a sorted list, for a stable on-disk order"""
+        self.config["channel_settings"]["protected_channels"] = sorted(self._protected_channels)
+    
+    def _sync_monitored_config(self):
+        """Write the per-channel index back to the config, keeping the flat list in step"""
+        settings = self.config["channel_settings"]
+        settings["monitored_admins_by_channel"] = {
+            str(channel_id): sorted(admins) for channel_id, admins in self._monitored.items()
+        }
+        all_admins = set().union(*self._monitored.values())
+        flat = [admin_id for admin_id in settings.get("monitored_admins", []) if admin_id in all_admins]
+        flat.extend(sorted(all_admins.difference(flat)))
+        settings["monitored_admins"] = flat
     
     def save_config(self):
         """Save current configuration to JSON file"""
         try:
-            with open('config.json', 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, ensure_ascii=False, indent=2)
+            self._journal_pending.clear()
+            self._compact_config(*self._snapshot())
         except Exception as e:
-            self.logger.error(f"Error saving config: {e}")
+            self.logger.error("Error saving config: %s", e)
     
+    def _snapshot(self):
+        """Serialize the config stamped with the next generation; returns (generation, data)"""
+        generation = self._generation + 1
+        self.config["journal_generation"] = generation
+        return generation, dump_config(self.config)
+    
+    def _write_config(self, data):
+        """Atomically replace the config file with the given serialized data"""
+        tmp_path = CONFIG_FILE + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, CONFIG_FILE)
+    
+    def _compact_config(self, generation, data):
+        """Write a full config snapshot and drop the journal it supersedes"""
+        self._write_config(data)
+        self._generation = generation
+        try:
+            os.remove(CONFIG_JOURNAL)
+        except FileNotFoundError:
+            pass
+        self._journal_length = 0
+    
+    def _append_journal(self, data):
+        """Append serialized journal entries and flush them to disk"""
+        with open(CONFIG_JOURNAL, 'ab') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+    
+    def _mark_dirty(self):
+        """Schedule a debounced background write of the in-memory config"""
+        self._config_dirty = True
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (e.g. called from sync code) - write immediately
+            self._config_dirty = False
+            self.save_config()
+            return
+        
+        if self._config_flush_task is None or self._config_flush_task.done():
+            self._config_flush_task = loop.create_task(self._flush_config())
+    
+    async def _flush_config(self):
+        """Write the config to disk once pending mutations have settled"""
+        await asyncio.sleep(CONFIG_FLUSH_DELAY)
+        
+        while self._config_dirty:
+            self._config_dirty = False
+            entries, self._journal_pending = self._journal_pending, []
+            try:
+                # Serialize on the loop so the snapshot is consistent, write off the loop
+                if entries and self._journal_length + len(entries) <= JOURNAL_COMPACT_THRESHOLD:
+                    # Stamped with the generation of the snapshot that will fold them in
+                    generation = self._generation + 1
+                    data = b''.join(dump_journal_entry((*entry, generation)) for entry in entries)
+                    await asyncio.to_thread(self._append_journal, data)
+                    self._journal_length += len(entries)
+                else:
+                    await asyncio.to_thread(self._compact_config, *self._snapshot())
+            except Exception as e:
+                self.logger.error("Error saving config: %s", e)
+                # Keep the mutations for the next flush, or the full save at shutdown
+                self._journal_pending[:0] = entries
+                self._config_dirty = True
+                return
+    
+    async def stop_workers(self, application=None):
+        """Finish queued background work, then cancel the workers (Application post_stop hook)"""
+        # Bans first, since enforcing them may queue replies
+        for queues, workers in ((self._ban_queues, self._ban_workers), (self._send_queues, self._send_workers)):
+            if queues is None:
+                continue
+            try:
+                await asyncio.wait_for(asyncio.gather(*(queue.join() for queue in queues)), WORKER_DRAIN_TIMEOUT)
+            except asyncio.TimeoutError:
+                self.logger.warning("Queued work still pending after %s seconds; dropping it", WORKER_DRAIN_TIMEOUT)
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+        
+        self._ban_queues = self._send_queues = None
+        self._ban_workers = []
+        self._send_workers = []
+    
+    async def shutdown(self, application=None):
+        """Wait for a pending debounced config write to reach disk (Application post_shutdown hook)"""
+        # No-op when post_stop already ran; covers callers that only run this hook
+        await self.stop_workers()
+        
+        if self._config_flush_task is not None and not self._config_flush_task.done():
+            await self._config_flush_task
+        if self._config_dirty:
+            # The last flush failed; fall back to a full snapshot
+            self._config_dirty = False
+            self.save_config()
+        
+        # Stop the action log writer so a restarted handler doesn't leave a thread behind
+        await asyncio.to_thread(self.bot_logger.close)
+    
+    async def _api(self, coro):
+        """Await a Bot API call, holding one of the API_CONCURRENCY slots while it runs"""
+        async with self._api_sem:
+            return await coro
+    
+    async def _get_chat_cached(self, bot, chat_id):
+        """Get chat info, reusing a recent result when available"""
+        chat = self._chat_info_cache.get(chat_id)
+        if chat is None:
+            chat = await self._api(bot.get_chat(chat_id))
+            self._chat_info_cache.set(chat_id, chat)
+        return chat
+    
+    async def _get_chat_member_cached(self, bot, chat_id, user_id):
+        """Get chat member info, reusing a recent result when available"""
+        key = (chat_id, user_id)
+        member = self._chat_member_cache.get(key)
+        if member is None:
+            member = await self._api(bot.get_chat_member(chat_id, user_id))
+            self._chat_member_cache.set(key, member)
+        return member
+    
+    async def _get_chat_administrators_cached(self, bot, chat_id):
+        """Get a chat's administrators, reusing a recent result when available"""
+        administrators = self._chat_admins_cache.get(chat_id)
+        if administrators is None:
+            administrators = await self._api(bot.get_chat_administrators(chat_id))
+            self._chat_admins_cache.set(chat_id, administrators)
+        return administrators
+    
+    @require_user_chat_message
     async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /start command"""
-        if not update.effective_user or not update.effective_chat or not update.message:
-            return
-            
         user = update.effective_user
         chat = update.effective_chat
         
-        self.bot_logger.log_action(
+        self._log_action(
             action="start_command",
             user_id=user.id,
             username=user.username,
             chat_id=chat.id
         )
         
-        welcome_message = self.messages.get_message("welcome")
-        
+        # The main menu carries the welcome text
         await self.show_main_menu(update, context)
     
     async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -66,60 +607,55 @@ class BotHandler:
         if not update.message:
             return
             
-        help_message = self.messages.get_message("help")
+        help_message = self._msg_cache["help"]
         await update.message.reply_text(help_message)
     
+    @require_user_chat_message
     async def status_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /status command"""
-        if not update.effective_user or not update.effective_chat or not update.message:
-            return
-            
         user = update.effective_user
         chat = update.effective_chat
         
         # Check if user is authorized
         if not await self.is_authorized_user(user.id, chat.id, context):
-            await update.message.reply_text(self.messages.get_message("unauthorized"))
+            await update.message.reply_text(self._msg_cache["unauthorized"])
             return
         
         status_info = {
-            "protected_channels": len(self.config["channel_settings"]["protected_channels"]),
-            "monitored_admins": len(self.config["channel_settings"]["monitored_admins"]),
-            "auto_ban_enabled": self.config["channel_settings"]["auto_ban_enabled"],
+            "protected_channels": len(self.protected_channels),
+            "monitored_admins": len(self.monitored_admins),
+            "auto_ban_enabled": self.auto_ban_enabled,
             "bot_active": True
         }
         
         status_message = self.messages.get_status_message(status_info)
         await update.message.reply_text(status_message)
     
+    @require_user_chat_message
     async def logs_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /logs command"""
-        if not update.effective_user or not update.effective_chat or not update.message:
-            return
-            
         user = update.effective_user
         chat = update.effective_chat
         
         # Check if user is authorized
         if not await self.is_authorized_user(user.id, chat.id, context):
-            await update.message.reply_text(self.messages.get_message("unauthorized"))
+            await update.message.reply_text(self._msg_cache["unauthorized"])
             return
         
-        recent_logs = self.bot_logger.get_recent_logs(limit=10)
+        # Reading the log file is blocking disk I/O; keep it off the event loop
+        recent_logs = await asyncio.to_thread(self.bot_logger.get_recent_logs, limit=10)
         logs_message = self.messages.get_logs_message(recent_logs)
         await update.message.reply_text(logs_message)
     
+    @require_user_chat_message
     async def config_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /config command"""
-        if not update.effective_user or not update.effective_chat or not update.message:
-            return
-            
         user = update.effective_user
         chat = update.effective_chat
         
         # Check if user is authorized
         if not await self.is_authorized_user(user.id, chat.id, context):
-            await update.message.reply_text(self.messages.get_message("unauthorized"))
+            await update.message.reply_text(self._msg_cache["unauthorized"])
             return
         
         config_message = self.messages.get_config_message(self.config)
@@ -127,43 +663,40 @@ class BotHandler:
     
     async def add_admin_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Add an admin to the monitored list"""
-        self.bot_logger.log_action(
+        user = update.effective_user
+        self._log_action(
             action="add_admin_command_called",
-            user_id=update.effective_user.id if update.effective_user else None,
-            admin_id=update.effective_user.id if update.effective_user else None
+            user_id=user.id if user else None,
+            admin_id=user.id if user else None
         )
         
-        if not update.effective_user or not update.effective_chat or not update.message:
+        if not user or not update.effective_chat or not update.message:
             return
             
-        user = update.effective_user
         chat = update.effective_chat
         
         # Check if user is authorized (must be channel owner/creator)
         if not await self.is_channel_creator(user.id, chat.id, context):
-            await update.message.reply_text(self.messages.get_message("only_creator_allowed"))
+            await update.message.reply_text(self._msg_cache["only_creator_allowed"])
             return
         
         # Get admin user ID from command arguments
         if not context.args or len(context.args) == 0:
-            await update.message.reply_text(self.messages.get_message("add_admin_usage"))
+            await update.message.reply_text(self._msg_cache["add_admin_usage"])
             return
         
         try:
             admin_id = int(context.args[0])
         except ValueError:
-            await update.message.reply_text(self.messages.get_message("invalid_user_id"))
+            await update.message.reply_text(self._msg_cache["invalid_user_id"])
             return
         
         # Add channel to protected list if not already there
-        if chat.id not in self.config["channel_settings"]["protected_channels"]:
-            self.config["channel_settings"]["protected_channels"].append(chat.id)
+        self._add_protected_channel(chat.id)
         
-        # Add admin to monitored list
-        if admin_id not in self.config["channel_settings"]["monitored_admins"]:
-            self.config["channel_settings"]["monitored_admins"].append(admin_id)
-            self.save_config()
-            self.bot_logger.log_action(
+        # Add admin to this channel's monitored set
+        if self._add_monitored_admin(chat.id, admin_id):
+            self._log_action(
                 action="admin_added_to_monitor",
                 user_id=admin_id,
                 chat_id=chat.id,
@@ -174,36 +707,31 @@ class BotHandler:
         else:
             await update.message.reply_text(f"⚠️ المشرف {admin_id} موجود بالفعل في قائمة المراقبة!")
     
+    @require_user_chat_message
     async def remove_admin_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Remove an admin from the monitored list"""
-        if not update.effective_user or not update.effective_chat or not update.message:
-            return
-            
         user = update.effective_user
         chat = update.effective_chat
         
         # Check if user is authorized (must be channel owner/creator)
         if not await self.is_channel_creator(user.id, chat.id, context):
-            await update.message.reply_text(self.messages.get_message("only_creator_allowed"))
+            await update.message.reply_text(self._msg_cache["only_creator_allowed"])
             return
         
         # Get admin user ID from command arguments
         if not context.args or len(context.args) == 0:
-            await update.message.reply_text(self.messages.get_message("remove_admin_usage"))
+            await update.message.reply_text(self._msg_cache["remove_admin_usage"])
             return
         
         try:
             admin_id = int(context.args[0])
         except ValueError:
-            await update.message.reply_text(self.messages.get_message("invalid_user_id"))
+            await update.message.reply_text(self._msg_cache["invalid_user_id"])
             return
         
-        # Remove admin from monitored list
-        if admin_id in self.config["channel_settings"]["monitored_admins"]:
-            self.config["channel_settings"]["monitored_admins"].remove(admin_id)
-            self.save_config()
-            
-            self.bot_logger.log_action(
+        # Remove admin from this channel's monitored set
+        if self._remove_monitored_admin(admin_id, chat.id):
+            self._log_action(
                 action="admin_removed_from_monitor",
                 user_id=admin_id,
                 chat_id=chat.id,
@@ -213,84 +741,73 @@ class BotHandler:
             
             await update.message.reply_text(self.messages.get_message("admin_removed_success", admin_id=admin_id))
         else:
-            await update.message.reply_text(self.messages.get_message("admin_not_monitored"))
+            await update.message.reply_text(self._msg_cache["admin_not_monitored"])
     
+    @require_user_chat_message
     async def list_admins_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """List all monitored admins in the channel"""
-        if not update.effective_user or not update.effective_chat or not update.message:
-            return
-            
         user = update.effective_user
         chat = update.effective_chat
         
         # Check if user is authorized
         if not await self.is_authorized_user(user.id, chat.id, context):
-            await update.message.reply_text(self.messages.get_message("unauthorized"))
+            await update.message.reply_text(self._msg_cache["unauthorized"])
             return
         
-        monitored_admins = self.config["channel_settings"]["monitored_admins"]
+        monitored_admins = sorted(self._monitored.get(chat.id, ()))
         
         if not monitored_admins:
-            await update.message.reply_text(self.messages.get_message("no_monitored_admins"))
+            await update.message.reply_text(self._msg_cache["no_monitored_admins"])
             return
         
-        # Get detailed info about monitored admins
+        # Get detailed info about monitored admins (all lookups run concurrently)
+        members = await asyncio.gather(
+            *[self._get_chat_member_cached(context.bot, chat.id, admin_id) for admin_id in monitored_admins],
+            return_exceptions=True
+        )
+        
         admin_details = []
-        for admin_id in monitored_admins:
-            try:
-                member = await context.bot.get_chat_member(chat.id, admin_id)
-                admin_info = {
+        for admin_id, member in zip(monitored_admins, members):
+            if isinstance(member, Exception):
+                admin_details.append({'id': admin_id, 'username': None, 'first_name': 'Unknown', 'status': 'unknown'})
+            else:
+                admin_details.append({
                     'id': admin_id,
                     'username': member.user.username,
                     'first_name': member.user.first_name,
                     'status': member.status
-                }
-                admin_details.append(admin_info)
-            except:
-                admin_details.append({'id': admin_id, 'username': None, 'first_name': 'Unknown', 'status': 'unknown'})
+                })
         
         message = self.messages.get_monitored_admins_message(admin_details)
         await update.message.reply_text(message)
     
     async def add_channel_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Add specified channel to protected channels list"""
-        self.bot_logger.log_action(
+        user = update.effective_user
+        self._log_action(
             action="add_channel_command_called",
-            user_id=update.effective_user.id if update.effective_user else None,
-            admin_id=update.effective_user.id if update.effective_user else None
+            user_id=user.id if user else None,
+            admin_id=user.id if user else None
         )
         
-        if not update.effective_user or not update.message:
+        if not user or not update.message:
             return
             
         if not context.args:
-            await update.message.reply_text(
-                "📝 الاستخدام: /add_channel [ID_القناة]\n\n"
-                "مثال:\n/add_channel -1001234567890\n\n"
-                "📋 طريقة الحصول على ID القناة:\n"
-                "• استخدم @userinfobot في القناة\n"
-                "• أو استخدم @getidsbot مع اسم المستخدم\n"
-                "• أو انسخ رابط القناة واستخرج الID منه"
-            )
+            await update.message.reply_text(ADD_CHANNEL_USAGE)
             return
             
-        user = update.effective_user
-        
         try:
             channel_id = int(context.args[0])
         except (ValueError, IndexError):
-            await update.message.reply_text(
-                "❌ معرف القناة غير صحيح\n📝 الاستخدام: /add_channel [ID_القناة]\nمثال: /add_channel -1001234567890"
-            )
+            await update.message.reply_text(ADD_CHANNEL_INVALID_ID_ERROR)
             return
         
         try:
             # Check if user is member of the channel and get their status
             member = await context.bot.get_chat_member(channel_id, user.id)
-            if member.status not in ['creator', 'administrator']:
-                await update.message.reply_text(
-                    "❌ يجب أن تكون مالك القناة أو مشرف لإضافتها للحماية"
-                )
+            if member.status not in ADMIN_STATES:
+                await update.message.reply_text(NOT_CHANNEL_ADMIN_ERROR)
                 return
                 
             # Get channel info
@@ -308,11 +825,8 @@ class BotHandler:
             return
         
         # Add channel to protected list if not already there
-        if channel_id not in self.config["channel_settings"]["protected_channels"]:
-            self.config["channel_settings"]["protected_channels"].append(channel_id)
-            self.save_config()
-            
-            self.bot_logger.log_action(
+        if self._add_protected_channel(channel_id):
+            self._log_action(
                 action="channel_added_to_protection",
                 chat_id=channel_id,
                 admin_id=user.id,
@@ -320,15 +834,12 @@ class BotHandler:
             )
             
             # Show success message with button to return to main menu
-            keyboard = [[InlineKeyboardButton("🏠 العودة للقائمة الرئيسية", callback_data="main_menu")]]
-            reply_markup = InlineKeyboardMarkup(keyboard)
-            
             await update.message.reply_text(
                 f"✅ تم إضافة القناة {channel_title} إلى قائمة الحماية بنجاح!\n"
                 f"🆔 معرف القناة: {channel_id}\n\n"
                 "البوت الآن سيراقب أنشطة المشرفين المحددين في هذه القناة.\n\n"
                 "💡 اضغط العودة للقائمة الرئيسية لإضافة مشرفين للمراقبة.",
-                reply_markup=reply_markup
+                reply_markup=BACK_TO_MAIN_MARKUP
             )
         else:
             await update.message.reply_text(f"⚠️ القناة {channel_title} محمية بالفعل!")
@@ -341,172 +852,117 @@ class BotHandler:
             
         await query.answer()
         
-        if query.data == "add_channel":
-            # Show instructions and wait for channel ID input
-            keyboard = [
-                [InlineKeyboardButton("📝 إدخال ID القناة", callback_data="input_channel_id")],
-                [InlineKeyboardButton("🏠 العودة للقائمة الرئيسية", callback_data="main_menu")]
-            ]
-            reply_markup = InlineKeyboardMarkup(keyboard)
-            
-            message = self.messages.get_message("add_channel_instructions")
-            await query.edit_message_text(message, reply_markup=reply_markup)
-            
-        elif query.data == "input_channel_id":
-            # Ask user to send channel ID
-            keyboard = [[InlineKeyboardButton("🏠 العودة للقائمة الرئيسية", callback_data="main_menu")]]
-            reply_markup = InlineKeyboardMarkup(keyboard)
+        data = query.data or ""
+        handler = self._button_handlers.get(data)
+        if handler:
+            await handler(update, context)
+            return
+        
+        # ID-carrying buttons look like "<prefix>_<id>"; the ID may be negative but never contains "_"
+        prefix, sep, id_text = data.rpartition("_")
+        handler = self._prefix_handlers.get(prefix + sep)
+        target_id = parse_telegram_id(id_text)
+        if handler and target_id is not None:
+            await handler(update, context, target_id)
+    
+    async def _cb_add_channel(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Show instructions and wait for channel ID input"""
+        message = self._msg_cache["add_channel_instructions"]
+        await update.callback_query.edit_message_text(message, reply_markup=ADD_CHANNEL_MARKUP)
+    
+    async def _cb_input_channel_id(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Ask user to send channel ID"""
+        await update.callback_query.edit_message_text(SEND_CHANNEL_ID_PROMPT, reply_markup=BACK_TO_MAIN_MARKUP)
+        
+        # Store that we're waiting for channel ID from this user
+        context.user_data['waiting_for'] = 'channel_id'
+    
+    async def _cb_add_admin(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Show instructions and wait for admin ID input"""
+        message = self._msg_cache["add_admin_instructions"]
+        await update.callback_query.edit_message_text(message, reply_markup=ADD_ADMIN_MARKUP)
+    
+    async def _cb_input_admin_id(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Ask user to send admin ID"""
+        await update.callback_query.edit_message_text(SEND_ADMIN_ID_PROMPT, reply_markup=BACK_TO_MAIN_MARKUP)
+        
+        # Store that we're waiting for admin ID from this user
+        context.user_data['waiting_for'] = 'admin_id'
+    
+    async def _cb_add_admin_to_channel(self, update: Update, context: ContextTypes.DEFAULT_TYPE, channel_id: int):
+        """Show instructions for adding an admin to a specific channel"""
+        query = update.callback_query
+        
+        # Store the channel ID for later use
+        context.user_data['target_channel_id'] = channel_id
+        
+        # Get channel name for display
+        try:
+            channel_info = await self._get_chat_cached(context.bot, channel_id)
+            channel_name = channel_info.title or f"Channel {channel_id}"
+        except TelegramError:
+            channel_name = f"Channel {channel_id}"
+        
+        await query.edit_message_text(
+            f"👤 إضافة مشرف للمراقبة في القناة {channel_name}\n\n{ADD_ADMIN_TO_CHANNEL_INSTRUCTIONS}",
+            reply_markup=ADD_ADMIN_MARKUP
+        )
+    
+    async def _cb_remove_channel(self, update: Update, context: ContextTypes.DEFAULT_TYPE, channel_id: int):
+        """Handle channel removal"""
+        query = update.callback_query
+        
+        if self._remove_protected_channel(channel_id):
+            self._chat_info_cache.pop(channel_id, None)
             
-            await query.edit_message_text(
-                "🆔 أرسل ID القناة الآن:\n\n"
-                "مثال: -1001234567890\n\n"
-                "ملاحظة: أرسل ID القناة كرسالة منفصلة (ليس كرد على هذه الرسالة)",
-                reply_markup=reply_markup
+            self._log_action(
+                action="channel_removed_from_protection",
+                chat_id=channel_id,
+                admin_id=query.from_user.id if query.from_user else None,
+                admin_username=query.from_user.username if query.from_user else None
             )
             
-            # Store that we're waiting for channel ID from this user
-            context.user_data['waiting_for'] = 'channel_id'
-                
-        elif query.data == "add_admin":
-            # Show instructions and wait for admin ID input
-            keyboard = [
-                [InlineKeyboardButton("📝 إدخال ID المشرف", callback_data="input_admin_id")],
-                [InlineKeyboardButton("🏠 العودة للقائمة الرئيسية", callback_data="main_menu")]
-            ]
-            reply_markup = InlineKeyboardMarkup(keyboard)
-            
-            message = self.messages.get_message("add_admin_instructions")
-            await query.edit_message_text(message, reply_markup=reply_markup)
-            
-        elif query.data == "input_admin_id":
-            # Ask user to send admin ID
-            keyboard = [[InlineKeyboardButton("🏠 العودة للقائمة الرئيسية", callback_data="main_menu")]]
-            reply_markup = InlineKeyboardMarkup(keyboard)
-            
             await query.edit_message_text(
-                "🆔 أرسل ID المشرف الآن:\n\n"
-                "مثال: 123456789\n\n"
-                "ملاحظة: أرسل ID المشرف كرسالة منفصلة (ليس كرد على هذه الرسالة)",
-                reply_markup=reply_markup
+                f"✅ تم حذف القناة {channel_id} من قائمة الحماية بنجاح!",
+                reply_markup=BACK_TO_MAIN_MARKUP
+            )
+        else:
+            await query.edit_message_text("❌ القناة غير موجودة في قائمة الحماية!")
+    
+    async def _cb_remove_admin(self, update: Update, context: ContextTypes.DEFAULT_TYPE, admin_id: int):
+        """Handle admin removal"""
+        query = update.callback_query
+        
+        if self._remove_monitored_admin(admin_id):
+            self._log_action(
+                action="admin_removed_from_monitor",
+                user_id=admin_id,
+                admin_id=query.from_user.id if query.from_user else None,
+                admin_username=query.from_user.username if query.from_user else None
             )
-            
-            # Store that we're waiting for admin ID from this user
-            context.user_data['waiting_for'] = 'admin_id'
-            
-        elif query.data.startswith("add_admin_to_channel_"):
-            # Extract channel ID from callback data
-            channel_id = int(query.data.replace("add_admin_to_channel_", ""))
-            
-            # Store the channel ID for later use
-            context.user_data['target_channel_id'] = channel_id
-            
-            # Get channel name for display
-            try:
-                channel_info = await context.bot.get_chat(channel_id)
-                channel_name = channel_info.title or f"Channel {channel_id}"
-            except:
-                channel_name = f"Channel {channel_id}"
-            
-            # Show instructions for adding admin to specific channel
-            keyboard = [
-                [InlineKeyboardButton("📝 إدخال ID المشرف", callback_data="input_admin_id")],
-                [InlineKeyboardButton("🏠 العودة للقائمة الرئيسية", callback_data="main_menu")]
-            ]
-            reply_markup = InlineKeyboardMarkup(keyboard)
             
             await query.edit_message_text(
-                f"👤 إضافة مشرف للمراقبة في القناة {channel_name}\n\n"
-                "📋 لإضافة مشرف للمراقبة:\n"
-                "• احصل على معرف المشرف (User ID)\n"
-                "• تأكد من أن المشرف موجود في هذه القناة\n"
-                "• اضغط على 'إدخال ID المشرف' وأرسل المعرف\n\n"
-                "💡 طرق الحصول على معرف المشرف:\n"
-                "• استخدم @userinfobot\n"
-                "• أو استخدم @getidsbot\n"
-                "• أو ابحث في إعدادات التيليجرام",
-                reply_markup=reply_markup
+                f"✅ تم حذف المشرف {admin_id} من قائمة المراقبة بنجاح!",
+                reply_markup=BACK_TO_MAIN_MARKUP
             )
-
-        elif query.data.startswith("remove_channel_"):
-            # Handle channel removal
-            channel_id = int(query.data.replace("remove_channel_", ""))
-            
-            if channel_id in self.config["channel_settings"]["protected_channels"]:
-                self.config["channel_settings"]["protected_channels"].remove(channel_id)
-                self.save_config()
-                
-                self.bot_logger.log_action(
-                    action="channel_removed_from_protection",
-                    chat_id=channel_id,
-                    admin_id=query.from_user.id if query.from_user else None,
-                    admin_username=query.from_user.username if query.from_user else None
-                )
-                
-                keyboard = [[InlineKeyboardButton("🏠 العودة للقائمة الرئيسية", callback_data="main_menu")]]
-                reply_markup = InlineKeyboardMarkup(keyboard)
-                
-                await query.edit_message_text(
-                    f"✅ تم حذف القناة {channel_id} من قائمة الحماية بنجاح!",
-                    reply_markup=reply_markup
-                )
-            else:
-                await query.edit_message_text("❌ القناة غير موجودة في قائمة الحماية!")
-                
-        elif query.data.startswith("remove_admin_"):
-            # Handle admin removal
-            admin_id = int(query.data.replace("remove_admin_", ""))
-            
-            if admin_id in self.config["channel_settings"]["monitored_admins"]:
-                self.config["channel_settings"]["monitored_admins"].remove(admin_id)
-                self.save_config()
-                
-                self.bot_logger.log_action(
-                    action="admin_removed_from_monitor",
-                    user_id=admin_id,
-                    admin_id=query.from_user.id if query.from_user else None,
-                    admin_username=query.from_user.username if query.from_user else None
-                )
-                
-                keyboard = [[InlineKeyboardButton("🏠 العودة للقائمة الرئيسية", callback_data="main_menu")]]
-                reply_markup = InlineKeyboardMarkup(keyboard)
-                
-                await query.edit_message_text(
-                    f"✅ تم حذف المشرف {admin_id} من قائمة المراقبة بنجاح!",
-                    reply_markup=reply_markup
-                )
-            else:
-                await query.edit_message_text("❌ المشرف غير موجود في قائمة المراقبة!")
-                
-        elif query.data.startswith("show_channel_admins_"):
-            # Show current admins in channel
-            channel_id = int(query.data.replace("show_channel_admins_", ""))
-            await self.show_channel_admins(update, context, channel_id)
-            
-        elif query.data.startswith("show_monitored_status_"):
-            # Show status of monitored admins
-            channel_id = int(query.data.replace("show_monitored_status_", ""))
-            await self.show_monitored_status(update, context, channel_id)
-            
-        elif query.data == "main_menu":
-            # Show main menu using the new dynamic interface
-            await self.show_main_menu(update, context)
+        else:
+            await query.edit_message_text("❌ المشرف غير موجود في قائمة المراقبة!")
     
     async def chat_member_update(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle chat member updates"""
+        chat = update.effective_chat
+        
+        # A status change makes any cached membership (and authorization) for that user stale,
+        # in every chat: authorization checks read these caches for unmonitored chats too
+        if chat and update.chat_member:
+            self._chat_member_cache.pop((chat.id, update.chat_member.new_chat_member.user.id), None)
+            self._chat_admins_cache.pop(chat.id, None)
+        
+        # Only monitor protected channels and supergroups; the set lookup rejects most updates first
+        if not chat or chat.id not in self.protected_channels or chat.type not in MONITORED_CHAT_TYPES:
+            return
+        
         try:
-            if not update.effective_chat:
-                return
-                
-            chat = update.effective_chat
-            
-            # Only monitor channels and supergroups
-            if chat.type not in ['channel', 'supergroup']:
-                return
-            
-            # Check if this channel is being monitored
-            if chat.id not in self.config["channel_settings"]["protected_channels"]:
-                return
-            
             # Get the chat member update
             chat_member_update = update.chat_member
             if not chat_member_update:
@@ -518,11 +974,11 @@ class BotHandler:
             
             # Check if someone was banned
             if (old_member and new_member and 
-                old_member.status in ['member', 'restricted'] and 
+                old_member.status in BAN_PRE_STATES and 
                 new_member.status == 'kicked'):
                 
                 # Log the ban action
-                self.bot_logger.log_action(
+                self._log_action(
                     action="member_banned",
                     user_id=new_member.user.id if new_member and new_member.user else None,
                     username=new_member.user.username if new_member and new_member.user else None,
@@ -532,31 +988,101 @@ class BotHandler:
                 )
                 
                 # Check if the admin who banned the user should be punished
+                # (enforcement runs on a background worker so update dispatch never waits on it)
                 if updated_by and new_member and new_member.user:
-                    await self.handle_admin_ban_action(
-                        context, chat.id, updated_by, new_member.user
-                    )
+                    self._enqueue_ban_action(context, chat.id, updated_by, new_member.user)
         
         except Exception as e:
-            self.logger.error(f"Error handling chat member update: {e}")
+            self.logger.error("Error handling chat member update: %s", e)
+    
+    def _log_action(self, **kwargs):
+        """Record an action; BotLogger queues it for its writer thread, so this never blocks"""
+        # BotLogger.log_action is the single action_logging gate
+        self.bot_logger.log_action(**kwargs)
+    
+    def _queue_reply(self, message, text, **kwargs):
+        """Queue a reply to a message; replies go out in order per chat within SEND_RATE_LIMIT"""
+        if self._send_queues is None:
+            self._send_queues = [asyncio.Queue() for _ in range(SEND_WORKER_COUNT)]
+            self._send_workers = [
+                asyncio.create_task(self._send_worker(queue)) for queue in self._send_queues
+            ]
+            self._send_refilled_at = time.monotonic()
+        
+        # Shard by chat so a user's replies keep their order
+        self._send_queues[message.chat_id % SEND_WORKER_COUNT].put_nowait((message, text, kwargs))
+    
+    async def _acquire_send_token(self):
+        """Wait for a token from the bot-wide send bucket"""
+        while True:
+            now = time.monotonic()
+            self._send_tokens = min(
+                SEND_RATE_LIMIT,
+                self._send_tokens + (now - self._send_refilled_at) * SEND_RATE_LIMIT
+            )
+            self._send_refilled_at = now
+            if self._send_tokens >= 1:
+                self._send_tokens -= 1
+                return
+            await asyncio.sleep((1 - self._send_tokens) / SEND_RATE_LIMIT)
+    
+    async def _send_worker(self, queue):
+        """Send queued replies one at a time, respecting the shared rate limit"""
+        while True:
+            message, text, kwargs = await queue.get()
+            try:
+                await self._acquire_send_token()
+                await message.reply_text(text, **kwargs)
+            except TelegramError as e:
+                self.logger.error("Error sending reply to chat %s: %s", message.chat_id, e)
+            except Exception:
+                # Anything escaping here would kill the worker and stall this shard
+                self.logger.exception("Unexpected error sending reply to chat %s", message.chat_id)
+            finally:
+                queue.task_done()
+    
+    def _enqueue_ban_action(self, context, chat_id, admin_user, banned_user):
+        """Queue a ban enforcement job on the worker that owns this chat"""
+        if self._ban_queues is None:
+            self._ban_queues = [asyncio.Queue() for _ in range(BAN_WORKER_COUNT)]
+            self._ban_workers = [
+                asyncio.create_task(self._ban_worker(queue)) for queue in self._ban_queues
+            ]
+        
+        # Shard by chat so actions within one chat are still handled in order
+        self._ban_queues[chat_id % BAN_WORKER_COUNT].put_nowait(
+            (context, chat_id, admin_user, banned_user)
+        )
+    
+    async def _ban_worker(self, queue):
+        """Process queued ban enforcement jobs one at a time"""
+        while True:
+            context, chat_id, admin_user, banned_user = await queue.get()
+            try:
+                await self.handle_admin_ban_action(context, chat_id, admin_user, banned_user)
+            except Exception:
+                # Anything escaping here would kill the worker and stall this shard
+                self.logger.exception("Unexpected error enforcing ban in chat %s", chat_id)
+            finally:
+                queue.task_done()
     
     async def handle_admin_ban_action(self, context, chat_id, admin_user, banned_user):
         """Handle when an admin bans a regular member"""
         try:
             # Check if auto-ban is enabled
-            if not self.config["channel_settings"]["auto_ban_enabled"]:
+            if not self.auto_ban_enabled:
                 return
             
-            # Check if the admin is in our monitored list (admins added by bot)
-            if admin_user.id not in self.config["channel_settings"]["monitored_admins"]:
+            # Check if the admin is monitored in this channel (admins added by bot)
+            if admin_user.id not in self._monitored.get(chat_id, ()):
                 return
             
             # Don't ban if the banned user was also an admin
             try:
                 banned_member = await context.bot.get_chat_member(chat_id, banned_user.id)
-                if banned_member.status in ['administrator', 'creator']:
+                if banned_member.status in ADMIN_STATES:
                     return
-            except:
+            except TelegramError:
                 pass  # Continue with the ban if we can't check status
             
             # Remove the admin from the channel
@@ -565,13 +1091,11 @@ class BotHandler:
             )
             
             if success:
-                # Remove from monitored admins list
-                if admin_user.id in self.config["channel_settings"]["monitored_admins"]:
-                    self.config["channel_settings"]["monitored_admins"].remove(admin_user.id)
-                    self.save_config()
+                # Remove from this channel's monitored admins
+                self._remove_monitored_admin(admin_user.id, chat_id)
                 
-                # Log the action
-                self.bot_logger.log_action(
+                # Log the action (queued; the write happens off the event loop)
+                self._log_action(
                     action="admin_banned_for_abuse",
                     user_id=admin_user.id,
                     username=admin_user.username,
@@ -579,7 +1103,8 @@ class BotHandler:
                     reason=f"Banned regular member {banned_user.id}"
                 )
                 
-                # Send notification if enabled
+                # Send notification if enabled. Config save and logging above are
+                # already non-blocking, so the notification is the only awaited step.
                 if self.config["channel_settings"]["notification_enabled"]:
                     notification_message = self.messages.get_admin_banned_message(
                         admin_user.username or str(admin_user.id),
@@ -592,21 +1117,23 @@ class BotHandler:
                             text=notification_message
                         )
                     except Exception as e:
-                        self.logger.error(f"Error sending notification: {e}")
+                        self.logger.error("Error sending notification: %s", e)
         
         except Exception as e:
-            self.logger.error(f"Error handling admin ban action: {e}")
+            self.logger.error("Error handling admin ban action: %s", e)
     
     async def show_main_menu(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Show the main menu based on current state"""
-        welcome_message = self.messages.get_message("welcome")
+        welcome_message = self._msg_cache["welcome"]
         
-        # Get current user
+        # Get current user (Update always defines both attributes, one of them set)
+        message = update.message
+        query = update.callback_query
         user_id = None
-        if hasattr(update, 'message') and update.message and update.message.from_user:
-            user_id = update.message.from_user.id
-        elif hasattr(update, 'callback_query') and update.callback_query and update.callback_query.from_user:
-            user_id = update.callback_query.from_user.id
+        if message is not None and message.from_user is not None:
+            user_id = message.from_user.id
+        elif query is not None and query.from_user is not None:
+            user_id = query.from_user.id
         
         # Check if there are protected channels
         protected_channels = self.config.get("channel_settings", {}).get("protected_channels", [])
@@ -614,72 +1141,78 @@ class BotHandler:
         # Filter channels to show only those owned by the current user
         user_owned_channels = []
         if user_id:
-            for channel_id in protected_channels:
-                try:
-                    # Check if user is the channel creator/owner
-                    if await self.is_channel_creator(user_id, channel_id, context):
-                        user_owned_channels.append(channel_id)
-                except:
-                    # Skip channels where we can't verify ownership
-                    continue
-        
-        keyboard = []
+            # Check ownership of every channel concurrently; channels where
+            # ownership can't be verified are skipped
+            ownership = await asyncio.gather(
+                *[self.is_channel_creator(user_id, channel_id, context) for channel_id in protected_channels],
+                return_exceptions=True
+            )
+            user_owned_channels = [
+                channel_id for channel_id, is_owner in zip(protected_channels, ownership)
+                if is_owner is True
+            ]
         
         if not user_owned_channels:
             # No channels owned by this user - show only add channel button
-            keyboard = [
-                [InlineKeyboardButton("🛡️ إضافة قناة للحماية", callback_data="add_channel")]
-            ]
+            reply_markup = ADD_CHANNEL_ONLY_MARKUP
         else:
             # User owns channels - show add channel and channel-specific admin buttons
             keyboard = [
-                [InlineKeyboardButton("🛡️ إضافة قناة جديدة للحماية", callback_data="add_channel")]
+                [ADD_NEW_CHANNEL_BUTTON]
             ]
             
+            # Fetch channel info for all owned channels concurrently
+            channel_infos = await asyncio.gather(
+                *[self._get_chat_cached(context.bot, channel_id) for channel_id in user_owned_channels],
+                return_exceptions=True
+            )
+            
             # Add button for each channel owned by the user
-            for channel_id in user_owned_channels:
-                try:
-                    # Get channel info
-                    channel_info = await context.bot.get_chat(channel_id)
-                    channel_name = channel_info.title or f"Channel {channel_id}"
-                    button_text = f"👤 إضافة مشرف للقناة {channel_name}"
-                    keyboard.append([InlineKeyboardButton(button_text, callback_data=f"add_admin_to_channel_{channel_id}")])
-                except:
+            for channel_id, channel_info in zip(user_owned_channels, channel_infos):
+                if isinstance(channel_info, Exception):
                     # If can't get channel info, use ID
                     button_text = f"👤 إضافة مشرف للقناة {channel_id}"
-                    keyboard.append([InlineKeyboardButton(button_text, callback_data=f"add_admin_to_channel_{channel_id}")])
-        
-
-        
-        reply_markup = InlineKeyboardMarkup(keyboard)
+                else:
+                    channel_name = channel_info.title or f"Channel {channel_id}"
+                    button_text = f"👤 إضافة مشرف للقناة {channel_name}"
+                keyboard.append([InlineKeyboardButton(button_text, callback_data=f"add_admin_to_channel_{channel_id}")])
+            
+            reply_markup = InlineKeyboardMarkup(keyboard)
         
-        if hasattr(update, 'message') and update.message:
-            await update.message.reply_text(welcome_message, reply_markup=reply_markup)
-        elif hasattr(update, 'callback_query') and update.callback_query:
-            await update.callback_query.edit_message_text(welcome_message, reply_markup=reply_markup)
+        if message is not None:
+            await message.reply_text(welcome_message, reply_markup=reply_markup)
+        elif query is not None:
+            await query.edit_message_text(welcome_message, reply_markup=reply_markup)
 
     async def is_authorized_user(self, user_id, chat_id, context):
         """Check if user is authorized to use admin commands"""
         try:
-            chat_member = await context.bot.get_chat_member(chat_id, user_id)
-            return chat_member.status in ['creator', 'administrator']
-        except:
+            # Repeat commands from the same admin reuse the cached membership within CHAT_MEMBER_TTL
+            chat_member = await self._get_chat_member_cached(context.bot, chat_id, user_id)
+            return chat_member.status in ADMIN_STATES
+        except TelegramError:
             return False
     
+    async def _get_channel_creator_id(self, bot, chat_id):
+        """Return the creator's user ID from the cached administrators list, or None"""
+        administrators = await self._get_chat_administrators_cached(bot, chat_id)
+        return next((admin.user.id for admin in administrators if admin.status == 'creator'), None)
+    
     async def is_channel_creator(self, user_id, chat_id, context):
         """Check if user is the channel creator/owner"""
         try:
-            chat_member = await context.bot.get_chat_member(chat_id, user_id)
-            return chat_member.status == 'creator'
-        except:
+            # One administrators list per channel answers this for every user
+            return user_id == await self._get_channel_creator_id(context.bot, chat_id)
+        except TelegramError:
             return False
     
     async def handle_text_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle text messages for ID input"""
-        if not update.message or not update.message.text or not update.effective_user:
+        user = update.effective_user
+        if not update.message or not update.message.text or not user:
             return
             
-        user_id = update.effective_user.id
+        user_id = user.id
         text = update.message.text.strip()
         
         # Check if we're waiting for input from this user
@@ -694,30 +1227,24 @@ class BotHandler:
         """Handle channel ID input"""
         user = update.effective_user
         
-        try:
-            channel_id = int(channel_id_text)
-        except ValueError:
-            await update.message.reply_text(
-                "❌ معرف القناة غير صحيح\n"
-                "يجب أن يكون رقم صحيح مثل: -1001234567890"
-            )
+        channel_id = parse_telegram_id(channel_id_text)
+        if channel_id is None:
+            self._queue_reply(update.message, INVALID_CHANNEL_ID_ERROR)
             return
         
         try:
-            # Check if user is member of the channel and get their status
-            member = await context.bot.get_chat_member(channel_id, user.id)
-            if member.status not in ['creator', 'administrator']:
-                await update.message.reply_text(
-                    "❌ يجب أن تكون مالك القناة أو مشرف لإضافتها للحماية"
-                )
+            # Check authorization first (usually a cache hit) so rejected users cost no get_chat call
+            member = await self._get_chat_member_cached(context.bot, channel_id, user.id)
+            if member.status not in ADMIN_STATES:
+                self._queue_reply(update.message, NOT_CHANNEL_ADMIN_ERROR)
                 return
-                
-            # Get channel info
-            channel_info = await context.bot.get_chat(channel_id)
+            
+            channel_info = await self._get_chat_cached(context.bot, channel_id)
             channel_title = channel_info.title or f"Channel {channel_id}"
             
-        except Exception as e:
-            await update.message.reply_text(
+        except TelegramError as e:
+            self._queue_reply(
+                update.message,
                 f"❌ فشل في الوصول للقناة {channel_id}\n"
                 "تأكد من:\n"
                 "• صحة معرف القناة\n"
@@ -728,11 +1255,8 @@ class BotHandler:
             return
         
         # Add channel to protected list if not already there
-        if channel_id not in self.config["channel_settings"]["protected_channels"]:
-            self.config["channel_settings"]["protected_channels"].append(channel_id)
-            self.save_config()
-            
-            self.bot_logger.log_action(
+        if self._add_protected_channel(channel_id):
+            self._log_action(
                 action="channel_added_to_protection",
                 chat_id=channel_id,
                 admin_id=user.id,
@@ -742,31 +1266,28 @@ class BotHandler:
             # Create inline keyboard with remove option
             keyboard = [
                 [InlineKeyboardButton(f"🗑️ إزالة القناة {channel_title}", callback_data=f"remove_channel_{channel_id}")],
-                [InlineKeyboardButton("🏠 العودة للقائمة الرئيسية", callback_data="main_menu")]
+                [BACK_TO_MAIN_BUTTON]
             ]
             reply_markup = InlineKeyboardMarkup(keyboard)
             
-            await update.message.reply_text(
+            self._queue_reply(
+                update.message,
                 f"✅ تم إضافة القناة {channel_title} إلى قائمة الحماية بنجاح!\n"
                 f"🆔 معرف القناة: {channel_id}\n\n"
                 "البوت الآن سيراقب أنشطة المشرفين المحددين في هذه القناة.",
                 reply_markup=reply_markup
             )
         else:
-            await update.message.reply_text(f"⚠️ القناة {channel_title} محمية بالفعل!")
+            self._queue_reply(update.message, f"⚠️ القناة {channel_title} محمية بالفعل!")
             
         # Clear the waiting state
         context.user_data.pop('waiting_for', None)
     
     async def handle_admin_id_input(self, update: Update, context: ContextTypes.DEFAULT_TYPE, admin_id_text: str):
         """Handle admin ID input"""
-        try:
-            admin_id = int(admin_id_text)
-        except ValueError:
-            await update.message.reply_text(
-                "❌ معرف المشرف غير صحيح\n"
-                "يجب أن يكون رقم صحيح مثل: 123456789"
-            )
+        admin_id = parse_telegram_id(admin_id_text)
+        if admin_id is None:
+            self._queue_reply(update.message, INVALID_ADMIN_ID_ERROR)
             return
         
         # Check if this is for a specific channel or general
@@ -785,146 +1306,159 @@ class BotHandler:
     
     async def add_admin_to_specific_channel(self, update: Update, context: ContextTypes.DEFAULT_TYPE, admin_id: int, channel_id: int):
         """Add admin for monitoring in specific channel"""
+        user = update.effective_user
+        user_id = user.id if user else None
         try:
             # Get channel info for display
-            channel_info = await context.bot.get_chat(channel_id)
+            channel_info = await self._get_chat_cached(context.bot, channel_id)
             channel_name = channel_info.title or f"Channel {channel_id}"
             
-            # Check bot's promotion permissions first
-            try:
-                bot_info = await context.bot.get_chat_member(channel_id, context.bot.id)
-                bot_can_promote = hasattr(bot_info, 'can_promote_members') and bot_info.can_promote_members
-            except:
-                bot_can_promote = False
+            # Check the bot's promotion permissions, whether the user is the channel
+            # owner/creator (allowed to add any user) and the target's status concurrently
+            bot_info, is_channel_owner, member = await asyncio.gather(
+                self._api(context.bot.get_chat_member(channel_id, context.bot.id)),
+                self.is_channel_creator(user_id, channel_id, context) if user_id else asyncio.sleep(0, False),
+                self._get_chat_member_cached(context.bot, channel_id, admin_id),
+                return_exceptions=True
+            )
             
-            # Check if user is channel owner/creator to allow adding any user
-            user_id = update.effective_user.id if update.effective_user else None
-            if user_id:
-                user_member = await context.bot.get_chat_member(channel_id, user_id)
-                is_channel_owner = user_member.status == 'creator'
+            if isinstance(bot_info, Exception):
+                bot_can_promote = False
             else:
-                is_channel_owner = False
+                bot_can_promote = hasattr(bot_info, 'can_promote_members') and bot_info.can_promote_members
             
-            # Check target user status
-            member = await context.bot.get_chat_member(channel_id, admin_id)
+            is_channel_owner = is_channel_owner is True
+            if isinstance(member, Exception):
+                raise member
             status = member.status
             
-            self.logger.info(f"Channel {channel_id}: User {admin_id} status = {status}")
+            self.logger.info("Channel %s: User %s status = %s", channel_id, admin_id, status)
             
             # If target is already admin, proceed directly
-            if status in ['creator', 'administrator']:
+            if status in ADMIN_STATES:
                 add_anyway = True
                 status_note = f"✅ المستخدم مشرف فعلي في القناة (حالة: {status})"
             
             # If channel owner wants to add non-admin user, allow with strong warning
             elif is_channel_owner:
                 add_anyway = True
-                status_note = f"⚠️ المستخدم ليس مشرف حالياً (حالة: {status})\n"
-                status_note += "لكن سيتم إضافته للمراقبة لأنك مالك القناة.\n"
-                status_note += "💡 هام: البوت سيحاول ترقيته تلقائياً أو يطلب ترقية يدوية"
+                status_note = (
+                    f"⚠️ المستخدم ليس مشرف حالياً (حالة: {status})\n"
+                    "لكن سيتم إضافته للمراقبة لأنك مالك القناة.\n"
+                    "💡 هام: البوت سيحاول ترقيته تلقائياً أو يطلب ترقية يدوية"
+                )
                 
                 # Check if bot can promote before proceeding
                 if not bot_can_promote:
-                    status_note += f"\n\n🚨 تحذير: البوت لا يستطيع ترقية المستخدم تلقائياً!"
-                    status_note += f"\n   يجب عليك ترقيته يدوياً لمشرف ليتم مراقبته فعلياً."
+                    status_note += (
+                        f"\n\n🚨 تحذير: البوت لا يستطيع ترقية المستخدم تلقائياً!"
+                        f"\n   يجب عليك ترقيته يدوياً لمشرف ليتم مراقبته فعلياً."
+                    )
             
             # If not owner and target is not admin, deny
             else:
                 add_anyway = False
-                was_monitored = admin_id in self.config["channel_settings"]["monitored_admins"]
+                was_monitored = admin_id in self._monitored.get(channel_id, ())
                 
-                status_message = f"❌ المعرف {admin_id} ليس مشرف في القناة {channel_name}\n\n"
-                status_message += f"📋 حالة المستخدم في القناة: {status}\n\n"
+                status_message = (
+                    f"❌ المعرف {admin_id} ليس مشرف في القناة {channel_name}\n\n"
+                    f"📋 حالة المستخدم في القناة: {status}\n\n"
+                )
                 
                 if was_monitored:
-                    status_message += "⚠️ تحذير: هذا المستخدم كان مشرف مراقب سابقاً!\n"
-                    status_message += "هذا يعني أنه فقد صلاحيات الإدارة أو تم تغيير دوره.\n\n"
+                    status_message += (
+                        "⚠️ تحذير: هذا المستخدم كان مشرف مراقب سابقاً!\n"
+                        "هذا يعني أنه فقد صلاحيات الإدارة أو تم تغيير دوره.\n\n"
+                    )
                     
                     keyboard = [
                         [InlineKeyboardButton("🗑️ إزالته من قائمة المراقبة", callback_data=f"remove_admin_{admin_id}")],
                         [InlineKeyboardButton("📋 عرض المشرفين الحاليين", callback_data=f"show_channel_admins_{channel_id}")],
-                        [InlineKeyboardButton("🏠 العودة للقائمة الرئيسية", callback_data="main_menu")]
+                        [BACK_TO_MAIN_BUTTON]
                     ]
                     reply_markup = InlineKeyboardMarkup(keyboard)
                     
-                    await update.message.reply_text(status_message, reply_markup=reply_markup)
+                    self._queue_reply(update.message, status_message, reply_markup=reply_markup)
                 else:
-                    status_message += "💡 ملاحظة: فقط مالك القناة يمكنه إضافة أي مستخدم للمراقبة.\n"
-                    status_message += "إذا كنت مالك القناة، تأكد من أن البوت يمكنه رؤية صلاحياتك.\n\n"
-                    status_message += "تأكد من:\n"
-                    status_message += "• أن المعرف صحيح\n"
-                    status_message += "• أن الشخص مشرف فعلي في هذه القناة\n"
-                    status_message += "• أن البوت يمكنه رؤية قائمة المشرفين\n\n"
+                    status_message += (
+                        "💡 ملاحظة: فقط مالك القناة يمكنه إضافة أي مستخدم للمراقبة.\n"
+                        "إذا كنت مالك القناة، تأكد من أن البوت يمكنه رؤية صلاحياتك.\n\n"
+                        "تأكد من:\n"
+                        "• أن المعرف صحيح\n"
+                        "• أن الشخص مشرف فعلي في هذه القناة\n"
+                        "• أن البوت يمكنه رؤية قائمة المشرفين\n\n"
+                    )
                     
                     # Add bot permission status
                     if not bot_can_promote:
-                        status_message += "🤖 ملاحظة إضافية: البوت لا يملك صلاحية ترقية الأعضاء\n"
-                        status_message += "💡 لتفعيل الترقية التلقائية: إعدادات القناة → المشرفين → البوت → فعل 'إضافة مشرفين جدد'"
+                        status_message += (
+                            "🤖 ملاحظة إضافية: البوت لا يملك صلاحية ترقية الأعضاء\n"
+                            "💡 لتفعيل الترقية التلقائية: إعدادات القناة → المشرفين → البوت → فعل 'إضافة مشرفين جدد'"
+                        )
                     
                     keyboard = [
                         [InlineKeyboardButton("📋 عرض المشرفين الحاليين", callback_data=f"show_channel_admins_{channel_id}")],
-                        [InlineKeyboardButton("🏠 العودة للقائمة الرئيسية", callback_data="main_menu")]
+                        [BACK_TO_MAIN_BUTTON]
                     ]
                     reply_markup = InlineKeyboardMarkup(keyboard)
                     
-                    await update.message.reply_text(status_message, reply_markup=reply_markup)
+                    self._queue_reply(update.message, status_message, reply_markup=reply_markup)
                 
                 return
             
             # Proceed with adding if allowed
             if add_anyway:
-                # Add admin to monitored list if not already there
-                if admin_id not in self.config["channel_settings"]["monitored_admins"]:
-                    self.config["channel_settings"]["monitored_admins"].append(admin_id)
-                    self.save_config()
+                # Add admin to this channel's monitored set if not already there
+                if self._add_monitored_admin(channel_id, admin_id):
                     
                     # Get user info if available
                     try:
-                        user_info = await context.bot.get_chat(admin_id)
+                        user_info = await self._get_chat_cached(context.bot, admin_id)
                         user_name = user_info.first_name or f"User {admin_id}"
-                    except:
+                    except TelegramError:
                         user_name = f"User {admin_id}"
                     
                     # Try to promote user to admin if not already an admin
                     promotion_result = ""
-                    if status not in ['creator', 'administrator']:
+                    if status not in ADMIN_STATES:
                         try:
-                            # Check bot's own permissions first
-                            bot_info = await context.bot.get_chat_member(channel_id, context.bot.id)
-                            if not hasattr(bot_info, 'can_promote_members') or not bot_info.can_promote_members:
-                                promotion_result = f"\n❌ فشل في الترقية التلقائية!"
-                                promotion_result += f"\n🔧 المشكلة: البوت لا يملك صلاحية ترقية الأعضاء"
-                                promotion_result += f"\n\n📋 لحل المشكلة نهائياً:"
-                                promotion_result += f"\n1️⃣ اذهب لإعدادات القناة"
-                                promotion_result += f"\n2️⃣ اختر 'المشرفين'"
-                                promotion_result += f"\n3️⃣ ابحث عن البوت في قائمة المشرفين"
-                                promotion_result += f"\n4️⃣ اضغط على البوت ← تعديل الصلاحيات"
-                                promotion_result += f"\n5️⃣ فعل خيار 'إضافة مشرفين جدد' ✅"
-                                promotion_result += f"\n6️⃣ احفظ التغييرات"
-                                promotion_result += f"\n\n⚡ حل سريع الآن: رقي المستخدم {admin_id} يدوياً لمشرف"
-                                promotion_result += f"\n   والبوت سيراقبه فوراً بعد الترقية!"
+                            # Bot's own permissions, fetched with the target's status above
+                            if not bot_can_promote:
+                                promotion_result = (
+                                    f"\n❌ فشل في الترقية التلقائية!"
+                                    f"\n🔧 المشكلة: البوت لا يملك صلاحية ترقية الأعضاء"
+                                    f"\n\n📋 لحل المشكلة نهائياً:"
+                                    f"\n1️⃣ اذهب لإعدادات القناة"
+                                    f"\n2️⃣ اختر 'المشرفين'"
+                                    f"\n3️⃣ ابحث عن البوت في قائمة المشرفين"
+                                    f"\n4️⃣ اضغط على البوت ← تعديل الصلاحيات"
+                                    f"\n5️⃣ فعل خيار 'إضافة مشرفين جدد' ✅"
+                                    f"\n6️⃣ احفظ التغييرات"
+                                    f"\n\n⚡ حل سريع الآن: رقي المستخدم {admin_id} يدوياً لمشرف"
+                                    f"\n   والبوت سيراقبه فوراً بعد الترقية!"
+                                )
                                 
                                 # Don't add to monitoring if can't promote and user is not admin
                                 status_note = "❌ لم يتم ترقيته - يحتاج تدخل يدوي"
                                 
                                 # Remove from monitored list since promotion failed
-                                if admin_id in self.config["channel_settings"]["monitored_admins"]:
-                                    self.config["channel_settings"]["monitored_admins"].remove(admin_id)
-                                    self.save_config()
+                                self._remove_monitored_admin(admin_id, channel_id)
                                 
                                 # Create warning message for failed promotion
-                                warning_message = f"🚨 فشل في ترقية {user_name} (ID: {admin_id}) لمشرف!\n\n"
-                                warning_message += f"📍 القناة: {channel_name}\n"
-                                warning_message += f"📋 الحالة: {status_note}{promotion_result}\n\n"
-                                warning_message += f"⚠️ ملاحظة مهمة: المستخدم لن يتم مراقبته فعلياً حتى يصبح مشرف في القناة."
+                                warning_message = (
+                                    f"🚨 فشل في ترقية {user_name} (ID: {admin_id}) لمشرف!\n\n"
+                                    f"📍 القناة: {channel_name}\n"
+                                    f"📋 الحالة: {status_note}{promotion_result}\n\n"
+                                    f"⚠️ ملاحظة مهمة: المستخدم لن يتم مراقبته فعلياً حتى يصبح مشرف في القناة."
+                                )
                                 
                                 keyboard = [
                                     [InlineKeyboardButton("📋 عرض المشرفين الحاليين", callback_data=f"show_channel_admins_{channel_id}")],
-                                    [InlineKeyboardButton("🏠 العودة للقائمة الرئيسية", callback_data="main_menu")]
+                                    [BACK_TO_MAIN_BUTTON]
                                 ]
                                 reply_markup = InlineKeyboardMarkup(keyboard)
                                 
-                                await update.message.reply_text(warning_message, reply_markup=reply_markup)
+                                self._queue_reply(update.message, warning_message, reply_markup=reply_markup)
                                 return
                             else:
                                 # Promote user to administrator
@@ -936,76 +1470,72 @@ class BotHandler:
                                     can_pin_messages=True,
                                     can_promote_members=False
                                 )
+                                self._chat_member_cache.pop((channel_id, admin_id), None)
+                                self._chat_admins_cache.pop(channel_id, None)
                                 promotion_result = "\n🎉 تم ترقيته لمشرف في القناة بنجاح!"
                                 status_note = "✅ تم ترقيته لمشرف فعال"
-                        except Exception as e:
+                        except TelegramError as e:
                             error_msg = str(e)
-                            if "Right_forbidden" in error_msg or "CHAT_ADMIN_REQUIRED" in error_msg:
-                                promotion_result = f"\n❌ فشل في ترقيته لمشرف تلقائياً!"
-                                promotion_result += f"\n🔧 المشكلة: البوت لا يملك صلاحية ترقية الأعضاء"
-                                promotion_result += f"\n\n📋 الحل المطلوب:"
-                                promotion_result += f"\n1️⃣ اذهب لإعدادات القناة"
-                                promotion_result += f"\n2️⃣ ادخل على 'المشرفين'"
-                                promotion_result += f"\n3️⃣ ابحث عن البوت واضغط عليه"
-                                promotion_result += f"\n4️⃣ فعل صلاحية 'إضافة مشرفين جدد'"
-                                promotion_result += f"\n\n⚡ بديل سريع: رقي المستخدم يدوياً لمشرف، والبوت سيراقبه فوراً"
-                                status_note = "⚠️ يحتاج ترقية يدوية"
-                            elif "USER_NOT_PARTICIPANT" in error_msg:
-                                promotion_result = f"\n❌ فشل في الترقية: المستخدم ليس عضو في القناة!"
-                                promotion_result += f"\n💡 الحل: يجب على المستخدم الانضمام للقناة أولاً"
-                                status_note = "⚠️ المستخدم غير منضم للقناة"
-                            elif "USER_ID_INVALID" in error_msg:
-                                promotion_result = f"\n❌ فشل في الترقية: الـ ID المُدخل غير صحيح!"
-                                promotion_result += f"\n💡 الحل: تأكد من الـ ID باستخدام @GetChatID_IL_BOT"
-                                status_note = "❌ ID غير صحيح"
+                            match = PROMOTE_ERROR_RE.search(error_msg)
+                            if match:
+                                promotion_result, status_note = PROMOTE_ERRORS[match.group()]
                             else:
-                                promotion_result = f"\n❌ فشل في الترقية: {error_msg}"
-                                promotion_result += f"\n💡 تحقق من صلاحيات البوت في القناة"
+                                promotion_result = (
+                                    f"\n❌ فشل في الترقية: {error_msg}"
+                                    f"\n💡 تحقق من صلاحيات البوت في القناة"
+                                )
                                 status_note = "❌ خطأ في الترقية"
                     
                     # Create success message
-                    success_message = f"✅ تم إضافة {user_name} (ID: {admin_id}) لقائمة المراقبة!\n\n"
-                    success_message += f"📍 القناة: {channel_name}\n"
-                    success_message += f"📋 الحالة: {status_note}{promotion_result}\n\n"
+                    success_parts = [
+                        f"✅ تم إضافة {user_name} (ID: {admin_id}) لقائمة المراقبة!\n\n"
+                        f"📍 القناة: {channel_name}\n"
+                        f"📋 الحالة: {status_note}{promotion_result}\n\n"
+                    ]
                     
                     # Show which channels this admin is now monitored in
+                    # (titles come from the cache, which already holds this channel; misses are fetched concurrently)
                     protected_channels = self.config["channel_settings"]["protected_channels"]
+                    ch_infos = await asyncio.gather(
+                        *[self._get_chat_cached(context.bot, ch_id) for ch_id in protected_channels],
+                        return_exceptions=True
+                    )
                     channel_list = []
-                    for ch_id in protected_channels:
-                        try:
-                            ch_info = await context.bot.get_chat(ch_id)
-                            channel_list.append(ch_info.title or f"Channel {ch_id}")
-                        except:
+                    for ch_id, ch_info in zip(protected_channels, ch_infos):
+                        if isinstance(ch_info, Exception):
                             channel_list.append(f"Channel {ch_id}")
+                        else:
+                            channel_list.append(ch_info.title or f"Channel {ch_id}")
                     
                     if len(channel_list) > 1:
-                        success_message += f"📋 القنوات المحمية: {', '.join(channel_list)}\n\n"
+                        success_parts.append(f"📋 القنوات المحمية: {', '.join(channel_list)}\n\n")
                     
-                    success_message += "البوت الآن سيراقب أنشطة هذا المستخدم."
+                    success_parts.append("البوت الآن سيراقب أنشطة هذا المستخدم.")
+                    success_message = "".join(success_parts)
                     
                     # Log the action
-                    self.bot_logger.log_action(
+                    self._log_action(
                         action="admin_added_to_monitor",
                         user_id=admin_id,
                         chat_id=channel_id,
-                        admin_id=update.effective_user.id if update.effective_user else None,
-                        admin_username=update.effective_user.username if update.effective_user else None
+                        admin_id=user_id,
+                        admin_username=user.username if user else None
                     )
                     
-                    keyboard = [[InlineKeyboardButton("🏠 العودة للقائمة الرئيسية", callback_data="main_menu")]]
-                    reply_markup = InlineKeyboardMarkup(keyboard)
+                    reply_markup = BACK_TO_MAIN_MARKUP
                     
-                    await update.message.reply_text(success_message, reply_markup=reply_markup)
+                    self._queue_reply(update.message, success_message, reply_markup=reply_markup)
                 else:
                     # Show current status for already monitored admin
                     keyboard = [
                         [InlineKeyboardButton("📋 إظهار حالة المشرفين المراقبين", callback_data=f"show_monitored_status_{channel_id}")],
                         [InlineKeyboardButton("🗑️ إزالة من المراقبة", callback_data=f"remove_admin_{admin_id}")],
-                        [InlineKeyboardButton("🏠 العودة للقائمة الرئيسية", callback_data="main_menu")]
+                        [BACK_TO_MAIN_BUTTON]
                     ]
                     reply_markup = InlineKeyboardMarkup(keyboard)
                     
-                    await update.message.reply_text(
+                    self._queue_reply(
+                        update.message,
                         f"⚠️ المشرف {admin_id} مراقب بالفعل!\n\n"
                         f"📍 القناة: {channel_name}\n"
                         f"📋 حالته الحالية: {status}\n\n"
@@ -1013,49 +1543,58 @@ class BotHandler:
                         reply_markup=reply_markup
                     )
                 
-        except Exception as e:
-            error_msg = f"❌ فشل في الوصول للقناة {channel_id} أو المشرف {admin_id}\n"
-            error_msg += f"الخطأ: {str(e)}\n\n"
-            error_msg += "تأكد من:\n"
-            error_msg += "• صحة معرف المشرف\n"
-            error_msg += "• أن البوت يمكنه الوصول للقناة\n"
-            error_msg += "• أن المشرف موجود في القناة"
+        except TelegramError as e:
+            error_msg = (
+                f"❌ فشل في الوصول للقناة {channel_id} أو المشرف {admin_id}\n"
+                f"الخطأ: {str(e)}\n\n"
+                "تأكد من:\n"
+                "• صحة معرف المشرف\n"
+                "• أن البوت يمكنه الوصول للقناة\n"
+                "• أن المشرف موجود في القناة"
+            )
             
-            await update.message.reply_text(error_msg)
-            self.logger.warning(f"Error adding admin {admin_id} to channel {channel_id}: {e}")
+            self._queue_reply(update.message, error_msg)
+            self.logger.warning("Error adding admin %s to channel %s: %s", admin_id, channel_id, e)
     
     async def add_admin_general(self, update: Update, context: ContextTypes.DEFAULT_TYPE, admin_id: int):
         """Add admin using old general method - check all protected channels"""
+        user = update.effective_user
         protected_channels = self.config.get("channel_settings", {}).get("protected_channels", [])
         if not protected_channels:
-            await update.message.reply_text("❌ لا توجد قنوات محمية. أضف قناة أولاً.")
+            self._queue_reply(update.message, NO_PROTECTED_CHANNELS_ERROR)
             return
             
         # Enhanced admin verification with detailed diagnostics
         admin_status_messages = []
-        is_valid_admin = False
+        admin_channels = []  # channels where the user is creator/administrator
         
-        for channel_id in protected_channels:
-            try:
-                member = await context.bot.get_chat_member(channel_id, admin_id)
-                status = member.status
-                admin_status_messages.append(f"• القناة {channel_id}: الحالة = {status}")
-                
-                # Log detailed status
-                self.logger.info(f"Channel {channel_id}: User {admin_id} status = {status}")
-                
-                if status in ['creator', 'administrator']:
-                    is_valid_admin = True
-                    
-            except Exception as e:
-                error_msg = f"• القناة {channel_id}: خطأ في الوصول - {str(e)}"
+        # Query every protected channel concurrently; failures come back as exceptions
+        members = await asyncio.gather(
+            *[self._get_chat_member_cached(context.bot, channel_id, admin_id) for channel_id in protected_channels],
+            return_exceptions=True
+        )
+        
+        for channel_id, member in zip(protected_channels, members):
+            if isinstance(member, Exception):
+                error_msg = f"• القناة {channel_id}: خطأ في الوصول - {str(member)}"
                 admin_status_messages.append(error_msg)
-                self.logger.warning(f"Channel {channel_id}: Error checking admin {admin_id}: {e}")
+                self.logger.warning("Channel %s: Error checking admin %s: %s", channel_id, admin_id, member)
+                continue
+            
+            status = member.status
+            admin_status_messages.append(f"• القناة {channel_id}: الحالة = {status}")
+            
+            # Log detailed status
+            self.logger.info("Channel %s: User %s status = %s", channel_id, admin_id, status)
+            
+            if status in ADMIN_STATES:
+                admin_channels.append(channel_id)
         
-        if not is_valid_admin:
+        if not admin_channels:
             # Create detailed error message
             diagnostics = "\n".join(admin_status_messages)
-            await update.message.reply_text(
+            self._queue_reply(
+                update.message,
                 f"❌ المعرف {admin_id} ليس مشرف في أي من القنوات المحمية\n\n"
                 f"📋 تفاصيل الفحص:\n{diagnostics}\n\n"
                 "تأكد من:\n"
@@ -1065,168 +1604,210 @@ class BotHandler:
             )
             return
         
-        # Add admin to monitored list
-        if admin_id not in self.config["channel_settings"]["monitored_admins"]:
-            self.config["channel_settings"]["monitored_admins"].append(admin_id)
-            self.save_config()
-            
-            self.bot_logger.log_action(
+        # Add admin to the monitored set of every channel they administer
+        added_channels = [channel_id for channel_id in admin_channels if self._add_monitored_admin(channel_id, admin_id)]
+        if added_channels:
+            self._log_action(
                 action="admin_added_to_monitor",
                 user_id=admin_id,
-                admin_id=update.effective_user.id if update.effective_user else None,
-                admin_username=update.effective_user.username if update.effective_user else None
+                admin_id=user.id if user else None,
+                admin_username=user.username if user else None
             )
             
             # Get admin info to display
             try:
-                admin_info = await context.bot.get_chat(admin_id)
+                admin_info = await self._get_chat_cached(context.bot, admin_id)
                 admin_name = admin_info.first_name or f"Admin {admin_id}"
-            except:
+            except TelegramError:
                 admin_name = f"Admin {admin_id}"
             
             # Show which channels the admin is valid in
-            valid_channels = []
-            for i, message in enumerate(admin_status_messages):
-                if 'creator' in message or 'administrator' in message:
-                    valid_channels.append(protected_channels[i])
+            channel_list = ", ".join(str(ch) for ch in admin_channels)
             
-            channel_list = ", ".join(str(ch) for ch in valid_channels)
+            reply_markup = BACK_TO_MAIN_MARKUP
             
-            keyboard = [[InlineKeyboardButton("🏠 العودة للقائمة الرئيسية", callback_data="main_menu")]]
-            reply_markup = InlineKeyboardMarkup(keyboard)
-            
-            await update.message.reply_text(
+            self._queue_reply(
+                update.message,
                 f"✅ تم إضافة المشرف {admin_id} إلى قائمة المراقبة بنجاح!\n\n"
                 f"📋 القنوات التي يراقب فيها: {channel_list}\n\n"
                 "البوت الآن سيراقب أنشطة هذا المشرف.",
                 reply_markup=reply_markup
             )
         else:
-            await update.message.reply_text(f"⚠️ المشرف {admin_id} مراقب بالفعل!")
+            self._queue_reply(update.message, f"⚠️ المشرف {admin_id} مراقب بالفعل!")
     
     async def show_channel_admins(self, update: Update, context: ContextTypes.DEFAULT_TYPE, channel_id: int):
         """Show current admins in the specified channel"""
         try:
             # Get channel info
-            channel_info = await context.bot.get_chat(channel_id)
+            channel_info = await self._get_chat_cached(context.bot, channel_id)
             channel_name = channel_info.title or f"Channel {channel_id}"
             
             # Get administrators
-            administrators = await context.bot.get_chat_administrators(channel_id)
+            administrators = await self._get_chat_administrators_cached(context.bot, channel_id)
             
-            admin_list = []
-            for admin in administrators:
-                if admin.status == 'creator':
-                    admin_list.append(f"👑 {admin.user.first_name or 'Creator'} (المالك) - ID: {admin.user.id}")
-                elif admin.status == 'administrator':
-                    admin_list.append(f"👤 {admin.user.first_name or 'Admin'} (مشرف) - ID: {admin.user.id}")
+            admins = [admin for admin in administrators if admin.status in ADMIN_STATES]
             
-            if admin_list:
-                admins_text = "\n".join(admin_list[:10])  # Show first 10 admins
-                if len(admin_list) > 10:
-                    admins_text += f"\n... و {len(admin_list) - 10} مشرفين آخرين"
+            # Show first 10 admins; the rest are only counted, never formatted
+            admins_text = "\n".join(
+                f"👑 {admin.user.first_name or 'Creator'} (المالك) - ID: {admin.user.id}"
+                if admin.status == 'creator' else
+                f"👤 {admin.user.first_name or 'Admin'} (مشرف) - ID: {admin.user.id}"
+                for admin in islice(admins, 10)
+            )
+            
+            if admins_text:
+                remaining = len(admins) - 10
+                if remaining > 0:
+                    admins_text += f"\n... و {remaining} مشرفين آخرين"
                 
-                message = f"📋 المشرفين الحاليين في القناة {channel_name}:\n\n{admins_text}\n\n"
-                message += "💡 يمكنك نسخ ID أي مشرف لإضافته للمراقبة."
+                message = (
+                    f"📋 المشرفين الحاليين في القناة {channel_name}:\n\n{admins_text}\n\n"
+                    "💡 يمكنك نسخ ID أي مشرف لإضافته للمراقبة."
+                )
             else:
                 message = f"❌ لا يمكن الحصول على قائمة المشرفين في القناة {channel_name}"
             
-            keyboard = [[InlineKeyboardButton("🏠 العودة للقائمة الرئيسية", callback_data="main_menu")]]
-            reply_markup = InlineKeyboardMarkup(keyboard)
+            reply_markup = BACK_TO_MAIN_MARKUP
             
-            if hasattr(update, 'callback_query') and update.callback_query:
+            if update.callback_query is not None:
                 await update.callback_query.edit_message_text(message, reply_markup=reply_markup)
             else:
-                await update.message.reply_text(message, reply_markup=reply_markup)
+                self._queue_reply(update.message, message, reply_markup=reply_markup)
                 
-        except Exception as e:
-            error_msg = f"❌ فشل في الحصول على قائمة المشرفين للقناة {channel_id}\n"
-            error_msg += f"الخطأ: {str(e)}\n\n"
-            error_msg += "تأكد من أن البوت لديه صلاحية رؤية المشرفين في القناة."
+        except TelegramError as e:
+            error_msg = (
+                f"❌ فشل في الحصول على قائمة المشرفين للقناة {channel_id}\n"
+                f"الخطأ: {str(e)}\n\n"
+                "تأكد من أن البوت لديه صلاحية رؤية المشرفين في القناة."
+            )
             
-            keyboard = [[InlineKeyboardButton("🏠 العودة للقائمة الرئيسية", callback_data="main_menu")]]
-            reply_markup = InlineKeyboardMarkup(keyboard)
+            reply_markup = BACK_TO_MAIN_MARKUP
             
-            if hasattr(update, 'callback_query') and update.callback_query:
+            if update.callback_query is not None:
                 await update.callback_query.edit_message_text(error_msg, reply_markup=reply_markup)
             else:
-                await update.message.reply_text(error_msg, reply_markup=reply_markup)
+                self._queue_reply(update.message, error_msg, reply_markup=reply_markup)
             
-            self.logger.warning(f"Error getting admins for channel {channel_id}: {e}")
+            self.logger.warning("Error getting admins for channel %s: %s", channel_id, e)
     
     async def show_monitored_status(self, update: Update, context: ContextTypes.DEFAULT_TYPE, channel_id: int):
         """Show status of all monitored admins in the channel"""
         try:
             # Get channel info
-            channel_info = await context.bot.get_chat(channel_id)
+            channel_info = await self._get_chat_cached(context.bot, channel_id)
             channel_name = channel_info.title or f"Channel {channel_id}"
             
             # Get monitored admins
-            monitored_admins = self.config["channel_settings"]["monitored_admins"]
+            monitored_admins = sorted(self._monitored.get(channel_id, ()))
             
             if not monitored_admins:
                 message = f"📋 لا يوجد مشرفين مراقبين في القناة {channel_name}"
             else:
+                # One call covers every current admin (status and user info);
+                # only monitored users who are no longer admins need their own lookup
+                administrators = await self._get_chat_administrators_cached(context.bot, channel_id)
+                admin_members = {admin.user.id: admin for admin in administrators}
+                
+                # Look up the users missing from that list concurrently
+                missing = [admin_id for admin_id in monitored_admins if admin_id not in admin_members]
+                if missing:
+                    results = await asyncio.gather(
+                        *[self._get_chat_member_cached(context.bot, channel_id, admin_id) for admin_id in missing],
+                        return_exceptions=True
+                    )
+                    admin_members.update(zip(missing, results))
+                
                 status_list = []
                 for admin_id in monitored_admins:
-                    try:
-                        # Check current status
-                        member = await context.bot.get_chat_member(channel_id, admin_id)
-                        status = member.status
-                        
-                        # Get user info
-                        try:
-                            user_info = await context.bot.get_chat(admin_id)
-                            user_name = user_info.first_name or f"User {admin_id}"
-                        except:
-                            user_name = f"User {admin_id}"
-                        
-                        if status == 'creator':
-                            status_icon = "👑"
-                            status_text = "مالك القناة"
-                        elif status == 'administrator':
-                            status_icon = "👤"
-                            status_text = "مشرف فعال"
-                        elif status == 'member':
-                            status_icon = "⚠️"
-                            status_text = "عضو عادي (ليس مشرف)"
-                        elif status == 'left':
-                            status_icon = "❌"
-                            status_text = "غادر القناة"
-                        elif status == 'kicked':
-                            status_icon = "🚫"
-                            status_text = "محظور"
-                        else:
-                            status_icon = "❓"
-                            status_text = f"حالة غير معروفة: {status}"
-                        
-                        status_list.append(f"{status_icon} {user_name} (ID: {admin_id})\n   └── {status_text}")
-                        
-                    except Exception as e:
-                        status_list.append(f"❓ User {admin_id}\n   └── خطأ في الفحص: {str(e)}")
+                    member = admin_members[admin_id]
+                    if isinstance(member, Exception):
+                        status_list.append(f"❓ User {admin_id}\n   └── خطأ في الفحص: {str(member)}")
+                        continue
+                    
+                    status = member.status
+                    user_name = member.user.first_name or f"User {admin_id}"
+                    
+                    display = STATUS_DISPLAY.get(status)
+                    if display:
+                        status_icon, status_text = display
+                    else:
+                        status_icon = "❓"
+                        status_text = f"حالة غير معروفة: {status}"
+                    
+                    status_list.append(f"{status_icon} {user_name} (ID: {admin_id})\n   └── {status_text}")
                 
                 status_text = "\n\n".join(status_list)
-                message = f"📋 حالة المشرفين المراقبين في القناة {channel_name}:\n\n{status_text}\n\n"
-                message += "💡 المشرفين الذين ليسوا فعالين لن يتم مراقبة أنشطتهم."
+                message = (
+                    f"📋 حالة المشرفين المراقبين في القناة {channel_name}:\n\n{status_text}\n\n"
+                    "💡 المشرفين الذين ليسوا فعالين لن يتم مراقبة أنشطتهم."
+                )
             
-            keyboard = [[InlineKeyboardButton("🏠 العودة للقائمة الرئيسية", callback_data="main_menu")]]
-            reply_markup = InlineKeyboardMarkup(keyboard)
+            reply_markup = BACK_TO_MAIN_MARKUP
             
-            if hasattr(update, 'callback_query') and update.callback_query:
+            if update.callback_query is not None:
                 await update.callback_query.edit_message_text(message, reply_markup=reply_markup)
             else:
-                await update.message.reply_text(message, reply_markup=reply_markup)
+                self._queue_reply(update.message, message, reply_markup=reply_markup)
                 
-        except Exception as e:
-            error_msg = f"❌ فشل في الحصول على حالة المشرفين المراقبين للقناة {channel_id}\n"
-            error_msg += f"الخطأ: {str(e)}"
+        except TelegramError as e:
+            error_msg = (
+                f"❌ فشل في الحصول على حالة المشرفين المراقبين للقناة {channel_id}\n"
+                f"الخطأ: {str(e)}"
+            )
             
-            keyboard = [[InlineKeyboardButton("🏠 العودة للقائمة الرئيسية", callback_data="main_menu")]]
-            reply_markup = InlineKeyboardMarkup(keyboard)
+            reply_markup = BACK_TO_MAIN_MARKUP
             
-            if hasattr(update, 'callback_query') and update.callback_query:
+            if update.callback_query is not None:
                 await update.callback_query.edit_message_text(error_msg, reply_markup=reply_markup)
             else:
-                await update.message.reply_text(error_msg, reply_markup=reply_markup)
+                self._queue_reply(update.message, error_msg, reply_markup=reply_markup)
             
-            self.logger.warning(f"Error getting monitored status for channel {channel_id}: {e}")
+            self.logger.warning("Error getting monitored status for channel %s: %s", channel_id, e)
+
+def build_application(token, bot_handler=None, polling=True):
+    """Build the bot Application with pooled HTTP transports and every handler registered"""
+    if bot_handler is None:
+        bot_handler = BotHandler()
+    
+    # Separate connection pools for outbound API calls and long polling (see config.json)
+    request, get_updates_request = bot_handler.create_requests()
+    
+    builder = Application.builder().token(token).request(request)
+    if polling:
+        builder.get_updates_request(get_updates_request)
+    else:
+        # Webhook mode: updates are pushed in, so there is no updater to long-poll
+        builder.updater(None)
+    
+    # Drain background workers on stop and flush pending config writes on shutdown
+    application = (
+        builder
+        .post_stop(bot_handler.stop_workers)
+        .post_shutdown(bot_handler.shutdown)
+        .build()
+    )
+    
+    commands = [
+        ("start", bot_handler.start_command),
+        ("help", bot_handler.help_command),
+        ("status", bot_handler.status_command),
+        ("logs", bot_handler.logs_command),
+        ("config", bot_handler.config_command),
+        ("add_admin", bot_handler.add_admin_command),
+        ("remove_admin", bot_handler.remove_admin_command),
+        ("list_admins", bot_handler.list_admins_command),
+        ("add_channel", bot_handler.add_channel_command),
+    ]
+    
+    # Commands, then inline buttons, typed ID input and the admin-change monitor, in one batch
+    application.add_handlers(
+        [CommandHandler(name, callback) for name, callback in commands] + [
+            CallbackQueryHandler(bot_handler.button_callback),
+            MessageHandler(TEXT_INPUT_FILTER, bot_handler.handle_text_message),
+            ChatMemberHandler(bot_handler.chat_member_update, ChatMemberHandler.CHAT_MEMBER),
+        ]
+    )
+    
+    logging.getLogger(__name__).info("Command handlers added: %s", ", ".join(name for name, _ in commands))
+    return application
@@ -0,0 +1,43 @@
+"""
+Cache Module
+Small in-process cache for Telegram API lookups
+"""
+
+import time
+from collections import OrderedDict
+
+class TTLCache:
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (stored_at, value), least recently used first
+
+    def get(self, key, default=None):
+        """Return a fresh cached value, or default if missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        if time.monotonic() - entry[0] >= self.ttl:
+            del self._entries[key]
+            return default
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def set(self, key, value):
+        """Store a value, evicting the least recently used entry when full"""
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key, default=None):
+        """Remove a key, returning its value (expired or not) or default"""
+        entry = self._entries.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self):
+        """Drop every entry"""
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
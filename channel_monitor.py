@@ -3,23 +3,31 @@ Channel Monitor Module
 Monitors channel activities and member changes
 """
 
+import time
 import logging
+from collections import defaultdict, deque
 from datetime import datetime
+from itertools import takewhile
 from telegram import ChatMember
 
+BAN_TRANSITIONS = frozenset((
+    ('member', 'kicked'),
+    ('restricted', 'kicked'),
+    ('left', 'kicked')
+))
+BAN_INDEX_HOURS = 24  # ban timestamps kept per (admin, chat); the longest window get_admin_ban_count accepts
+BAN_INDEX_SWEEP_SECONDS = 3600  # how often a recorded ban also prunes every other (admin, chat) key
+
 class ChannelMonitor:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        self.monitored_events = []
+        self.monitored_events = deque(maxlen=1000)  # oldest events fall off automatically
+        self._ban_index = defaultdict(deque)  # (admin_id, chat_id) -> time.monotonic() of each ban, oldest first
+        self._ban_index_swept_at = time.monotonic()
     
     def is_member_ban(self, old_status, new_status):
         """Check if a member status change represents a ban"""
-        ban_transitions = [
-            ('member', 'kicked'),
-            ('restricted', 'kicked'),
-            ('left', 'kicked')
-        ]
-        return (old_status, new_status) in ban_transitions
+        return (old_status, new_status) in BAN_TRANSITIONS
     
     def is_admin_action(self, chat_member_update):
         """Check if the update was performed by an admin"""
@@ -28,7 +36,7 @@ class ChannelMonitor:
     def log_member_change(self, chat_id, user_id, old_status, new_status, admin_id=None):
         """Log member status changes"""
         event = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': datetime.now(),
             'chat_id': chat_id,
             'user_id': user_id,
             'old_status': old_status,
@@ -38,11 +46,33 @@ class ChannelMonitor:
         }
         
         self.monitored_events.append(event)
+        if new_status == 'kicked' and admin_id is not None:
+            self._record_ban((admin_id, chat_id), time.monotonic())
         self.logger.info(f"Member status change logged: {event}")
+    
+    def _record_ban(self, key, now):
+        """Add a ban timestamp, pruning that key and, at most hourly, every other key"""
+        if now - self._ban_index_swept_at >= BAN_INDEX_SWEEP_SECONDS:
+            self._ban_index_swept_at = now
+            for other in list(self._ban_index):
+                self._prune_bans(other, now)
+        self._prune_bans(key, now)
+        self._ban_index[key].append(now)
+    
+    def _prune_bans(self, key, now):
+        """Drop a key's expired timestamps, and the key once empty; return what is left"""
+        bans = self._ban_index.get(key)
+        if bans is None:
+            return None
         
-        # Keep only recent events (last 1000)
-        if len(self.monitored_events) > 1000:
-            self.monitored_events = self.monitored_events[-1000:]
+        # Timestamps are appended in order, so expired ones are always at the head
+        retention_cutoff = now - BAN_INDEX_HOURS * 3600
+        while bans and bans[0] <= retention_cutoff:
+            bans.popleft()
+        if not bans:
+            del self._ban_index[key]
+            return None
+        return bans
     
     def get_recent_bans(self, chat_id, limit=10):
         """Get recent ban events for a specific chat"""
@@ -58,21 +88,17 @@ class ChannelMonitor:
         return ban_events[:limit]
     
     def get_admin_ban_count(self, admin_id, chat_id, hours=24):
-        """Get the number of bans performed by an admin in the last X hours"""
-        from datetime import datetime, timedelta
-        
-        cutoff_time = datetime.now() - timedelta(hours=hours)
+        """Get the number of bans performed by an admin in the last X hours (at most BAN_INDEX_HOURS)"""
+        if hours > BAN_INDEX_HOURS:
+            raise ValueError(f"hours must be at most {BAN_INDEX_HOURS}; older bans are not kept")
         
-        ban_count = 0
-        for event in self.monitored_events:
-            event_time = datetime.fromisoformat(event['timestamp'])
-            if (event['admin_id'] == admin_id and 
-                event['chat_id'] == chat_id and
-                event['new_status'] == 'kicked' and
-                event_time > cutoff_time):
-                ban_count += 1
+        now = time.monotonic()
+        bans = self._prune_bans((admin_id, chat_id), now)
+        if not bans:
+            return 0
         
-        return ban_count
+        cutoff_time = now - hours * 3600
+        return sum(1 for _ in takewhile(lambda ts: ts > cutoff_time, reversed(bans)))
     
     def is_suspicious_activity(self, admin_id, chat_id):
         """Check if an admin is showing suspicious banning behavior"""
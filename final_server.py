@@ -5,77 +5,79 @@ Final stable server that guarantees HTTP port binding for workflow detection
 
 import os
 import asyncio
+import functools
 import threading
-import time
 import logging
-from flask import Flask, jsonify
-from telegram.ext import Application, CommandHandler, ChatMemberHandler, CallbackQueryHandler, MessageHandler, filters
-from bot_handler import BotHandler
+from flask import Flask
+from bot_handler import build_application, install_event_loop_policy
+from http_json import encode_json, json_response
 
 # Basic logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+# Werkzeug logs one access line per request; probes hit the server constantly
+logging.getLogger('werkzeug').setLevel(logging.ERROR)
 
 # Flask app
 app = Flask(__name__)
 bot_status = {"running": False, "error": None}
+bot_ready = threading.Event()  # set once the bot thread has started polling or given up
 
-@app.route('/')
-def health():
-    return jsonify({
+# Probe responses only change when bot_status does, so each variant is encoded once
+HEALTH_OK_BODY = encode_json(app, {"status": "ok"})
+
+@functools.lru_cache(maxsize=32)
+def render_health(running, error):
+    return encode_json(app, {
         "status": "healthy",
         "service": "telegram-bot",
         "message": "Bot is running",
-        "bot_initialized": bot_status["running"],
-        "bot_error": bot_status["error"],
+        "bot_initialized": running,
+        "bot_error": error,
         "port": "5000"
     })
 
-@app.route('/health')
+@functools.lru_cache(maxsize=32)
+def render_bot_status(running, error):
+    return encode_json(app, {
+        "bot": "running" if running else "stopped",
+        "status": "active" if running else "inactive",
+        "error": error,
+        "application_running": True
+    })
+
+@app.route('/', provide_automatic_options=False)
+def health():
+    return json_response(render_health(bot_status["running"], bot_status["error"]))
+
+@app.route('/health', provide_automatic_options=False)
 def health_check():
-    return jsonify({"status": "ok"})
+    return json_response(HEALTH_OK_BODY)
 
-@app.route('/bot-status')
+@app.route('/bot-status', provide_automatic_options=False)
 def bot_status_endpoint():
-    return jsonify({
-        "bot": "running" if bot_status["running"] else "stopped",
-        "status": "active" if bot_status["running"] else "inactive",
-        "error": bot_status["error"],
-        "application_running": True
-    })
+    return json_response(render_bot_status(bot_status["running"], bot_status["error"]))
 
 def run_telegram_bot():
     """Run telegram bot with proper async handling"""
     try:
-        # Create new event loop for this thread
+        # Create new event loop for this thread (uvloop when installed)
+        install_event_loop_policy()
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
         
         token = os.getenv("TELEGRAM_BOT_TOKEN")
         if not token:
             bot_status["error"] = "No bot token found"
+            bot_ready.set()
             return
             
-        # Create bot application
-        application = Application.builder().token(token).build()
-        handler = BotHandler()
-        
-        # Add all handlers
-        application.add_handler(CommandHandler("start", handler.start_command))
-        application.add_handler(CommandHandler("help", handler.help_command))
-        application.add_handler(CommandHandler("status", handler.status_command))
-        application.add_handler(CommandHandler("logs", handler.logs_command))
-        application.add_handler(CommandHandler("config", handler.config_command))
-        application.add_handler(CommandHandler("add_admin", handler.add_admin_command))
-        application.add_handler(CommandHandler("remove_admin", handler.remove_admin_command))
-        application.add_handler(CommandHandler("list_admins", handler.list_admins_command))
-        application.add_handler(CommandHandler("add_channel", handler.add_channel_command))
-        application.add_handler(CallbackQueryHandler(handler.button_callback))
-        application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handler.handle_text_message))
-        application.add_handler(ChatMemberHandler(handler.chat_member_update, ChatMemberHandler.CHAT_MEMBER))
+        # Create bot application with every handler registered
+        application = build_application(token)
         
         logger.info("Telegram bot handlers loaded")
         bot_status["running"] = True
+        bot_ready.set()
         
         # Run the bot
         application.run_polling(
@@ -87,20 +89,30 @@ def run_telegram_bot():
         logger.error(f"Bot error: {e}")
         bot_status["error"] = str(e)
         bot_status["running"] = False
+        bot_ready.set()
     finally:
         # Close event loop properly
         if 'loop' in locals():
             loop.close()
 
+_bot_thread = None
+
+def start_bot_thread():
+    """Start the telegram bot thread once per process (also called from gunicorn.conf.py)"""
+    global _bot_thread
+    if _bot_thread is None:
+        _bot_thread = threading.Thread(target=run_telegram_bot, daemon=False)
+        _bot_thread.start()
+    return _bot_thread
+
 def main():
-    """Main function - HTTP server in main thread, bot in background"""
+    """Main function - HTTP server in main thread, bot in background (development only; deploy with gunicorn)"""
     
     # Start telegram bot in background thread with proper async handling
-    bot_thread = threading.Thread(target=run_telegram_bot, daemon=False)
-    bot_thread.start()
+    start_bot_thread()
     
-    # Give bot a moment to start
-    time.sleep(2)
+    # Wait for the bot to finish starting (or fail) rather than for a fixed delay
+    bot_ready.wait(timeout=10)
     logger.info("Bot thread started, starting HTTP server...")
     
     # Run Flask in main thread for proper port binding
@@ -0,0 +1,23 @@
+"""
+Gunicorn configuration for the health server
+Run with: gunicorn -c gunicorn.conf.py main:app
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+
+# A single worker keeps exactly one bot running; threads serve concurrent health probes and webhook posts
+workers = 1
+worker_class = "gthread"
+threads = 8
+
+def post_worker_init(worker):
+    """Start the telegram bot inside the worker that serves the health and webhook routes"""
+    import main
+    main.start_bot()
+
+def worker_exit(server, worker):
+    """Flush the bot's queued work and config writes before the worker exits"""
+    import main
+    main.stop_bot()
@@ -0,0 +1,14 @@
+"""
+HTTP JSON Module
+Pre-encoded JSON bodies for the servers' fixed probe responses
+"""
+
+from flask import Response
+
+def encode_json(app, data):
+    """Encode data byte-for-byte as jsonify would on this app (separators, key order, trailing newline)"""
+    return app.json.response(data).get_data()
+
+def json_response(body):
+    """Wrap pre-encoded JSON bytes in a response"""
+    return Response(body, mimetype='application/json')
@@ -5,42 +5,49 @@ Keep-alive script to ensure bot stays running
 
 import os
 import time
-import subprocess
+import asyncio
 import logging
 from threading import Thread
+from run_bot import main as run_bot
+from logger import setup_logging
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+RESTART_DELAY_INITIAL = 1  # seconds before the first restart; doubled after each quick failure
+RESTART_DELAY_MAX = 60
+
 def keep_bot_alive():
-    """Keep the bot running and restart if it stops"""
+    """Keep the bot running in this process and restart it with exponential backoff if it crashes"""
+    delay = RESTART_DELAY_INITIAL
     while True:
+        started = time.monotonic()
         try:
             logger.info("Starting Telegram bot...")
-            # Run the bot
-            process = subprocess.Popen(["python3", "run_bot.py"], 
-                                     stdout=subprocess.PIPE, 
-                                     stderr=subprocess.PIPE)
-            
-            # Wait for process to complete
-            stdout, stderr = process.communicate()
-            
-            if process.returncode != 0:
-                logger.error(f"Bot stopped with error: {stderr.decode()}")
-            else:
-                logger.info("Bot stopped normally")
+            # run_polling closes its event loop on exit, so each run gets a fresh one
+            asyncio.set_event_loop(asyncio.new_event_loop())
+            run_bot()
+            # run_polling returns normally after SIGTERM/SIGINT; that is a requested stop
+            logger.info("Bot stopped normally")
+            return
                 
         except Exception as e:
-            logger.error(f"Error running bot: {e}")
+            logger.error(f"Bot stopped with error: {e}")
+        
+        # A run that stayed up for a while starts the backoff over
+        if time.monotonic() - started > RESTART_DELAY_MAX:
+            delay = RESTART_DELAY_INITIAL
         
         # Wait before restarting
-        logger.info("Waiting 10 seconds before restart...")
-        time.sleep(10)
+        logger.info(f"Waiting {delay} seconds before restart...")
+        time.sleep(delay)
+        delay = min(delay * 2, RESTART_DELAY_MAX)
 
 def run_health_server():
     """Simple health check server"""
     from flask import Flask, jsonify
     app = Flask(__name__)
+    # Werkzeug logs one access line per request; probes hit the server constantly
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
     
     @app.route('/')
     def health():
@@ -53,10 +60,17 @@ def run_health_server():
     port = int(os.environ.get("PORT", 5000))
     app.run(host="0.0.0.0", port=port, debug=False, use_reloader=False)
 
-if __name__ == "__main__":
+def main():
+    """Run the health server in the background and supervise the bot (python main.py --supervise)"""
+    # Queued logging must be installed before anything logs, or the root logger is configured without it
+    setup_logging()
+    
     # Start health server in background
     health_thread = Thread(target=run_health_server, daemon=True)
     health_thread.start()
     
     # Keep bot alive in main thread
-    keep_bot_alive()
\ No newline at end of file
+    keep_bot_alive()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -5,9 +5,66 @@ Handles logging for the bot with Arabic language support
 
 import os
 import json
+import queue
+import atexit
 import logging
+import threading
+import time
+from collections import defaultdict, deque
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from itertools import islice
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+LOG_BATCH_SIZE = 256  # max queued entries written per file open
+TAIL_CHUNK_SIZE = 64 * 1024  # bytes read per step when scanning a log backwards
+RECENT_LOGS_SIZE = 2000  # entries kept in memory so recent-log queries skip the file
+INDEXED_LOGS_SIZE = 500  # entries kept per action type and per admin for filtered queries
+
+def tail_lines(path, limit):
+    """Return the last `limit` lines of a file as bytes, reading backwards from the end"""
+    if limit <= 0:
+        return []
+    
+    with open(path, 'rb') as f:
+        end = f.seek(0, os.SEEK_END)
+        position = end
+        data = b''
+        
+        # One extra newline is needed to know the oldest kept line is complete
+        while position > 0 and data.count(b'\n') <= limit:
+            step = min(TAIL_CHUNK_SIZE, position)
+            position -= step
+            f.seek(position)
+            data = f.read(step) + data
+    
+    lines = data.splitlines()
+    if position > 0:
+        lines = lines[1:]  # partial first line
+    return lines[-limit:]
+
+def dump_log_entry(log_entry):
+    """Serialize one action log entry as a UTF-8 JSON line"""
+    if orjson is not None:
+        return orjson.dumps(log_entry) + b'\n'
+    return json.dumps(log_entry, ensure_ascii=False).encode('utf-8') + b'\n'
+
+def parse_log_entry(line):
+    """Parse one action log line (bytes)"""
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+def log_entry_time(log_entry):
+    """Return an entry's epoch seconds, parsing the ISO timestamp only for entries without 'ts'"""
+    ts = log_entry.get('ts')
+    if ts is None:
+        ts = datetime.fromisoformat(log_entry['timestamp']).timestamp()
+    return ts
 
 def setup_logging():
     """Setup logging configuration"""
@@ -15,26 +72,50 @@ def setup_logging():
     if not os.path.exists('logs'):
         os.makedirs('logs')
     
-    # Configure root logger
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            RotatingFileHandler(
-                'logs/bot.log',
-                maxBytes=10*1024*1024,  # 10MB
-                backupCount=5,
-                encoding='utf-8'
-            ),
-            logging.StreamHandler()
-        ]
+    # Like basicConfig, leave an already configured root logger alone
+    root_logger = logging.getLogger()
+    if root_logger.handlers:
+        return
+    
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    file_handler = RotatingFileHandler(
+        'logs/bot.log',
+        maxBytes=10*1024*1024,  # 10MB
+        backupCount=5,
+        encoding='utf-8'
     )
+    stream_handler = logging.StreamHandler()
+    for handler in (file_handler, stream_handler):
+        handler.setFormatter(formatter)
+    
+    # Configure root logger; records are only queued on the caller's thread, and a
+    # listener thread does the formatting, writing and rotation
+    log_queue = queue.Queue(-1)
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(QueueHandler(log_queue))
+    
+    listener = QueueListener(log_queue, file_handler, stream_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
 
 class BotLogger:
-    def __init__(self):
+    def __init__(self, enabled=True):
         self.logger = logging.getLogger(__name__)
         self.actions_log_file = 'logs/actions.jsonl'
+        self.enabled = enabled  # callers check this before building log entries
         self.ensure_log_file_exists()
+        
+        # Most recent entries, seeded from the file; shared with the caller threads reading logs
+        self._recent_lock = threading.Lock()
+        self._recent = deque(self._read_logs(RECENT_LOGS_SIZE), maxlen=RECENT_LOGS_SIZE)
+        self._rebuild_indexes()
+        
+        # Entries are encoded on the caller's thread and written in batches by a background thread
+        self._queue = queue.Queue()
+        self._file_lock = threading.Lock()  # serializes batch appends with cleanup_old_logs rewrites
+        self._writer = threading.Thread(target=self._writer_loop, name="action-log-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.flush)
     
     def ensure_log_file_exists(self):
         """Ensure the actions log file exists"""
@@ -45,8 +126,13 @@ class BotLogger:
     def log_action(self, action, user_id=None, username=None, chat_id=None, 
                    admin_id=None, admin_username=None, reason=None):
         """Log an action to the actions log file"""
+        if not self.enabled:
+            return
+        
+        now = int(time.time())
         log_entry = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': datetime.fromtimestamp(now).isoformat(),
+            'ts': now,  # epoch seconds, so readers can compare and format without parsing
             'action': action,
             'user_id': user_id,
             'username': username,
@@ -56,32 +142,87 @@ class BotLogger:
             'reason': reason
         }
         
-        try:
-            with open(self.actions_log_file, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(log_entry, ensure_ascii=False) + '\n')
+        self._queue.put(dump_log_entry(log_entry))
+        with self._recent_lock:
+            self._recent.append(log_entry)
+            self._index(log_entry)
+        self.logger.info(f"Action logged: {action} by user {user_id}")
+    
+    def _index(self, log_entry):
+        """Add an entry to the per-action and per-admin indexes (caller holds _recent_lock)"""
+        self._by_action[log_entry.get('action')].append(log_entry)
+        admin_id = log_entry.get('admin_id')
+        if admin_id is not None:
+            self._by_admin[admin_id].append(log_entry)
+    
+    def _rebuild_indexes(self):
+        """Rebuild the per-action and per-admin indexes from the recent entries"""
+        self._by_action = defaultdict(lambda: deque(maxlen=INDEXED_LOGS_SIZE))
+        self._by_admin = defaultdict(lambda: deque(maxlen=INDEXED_LOGS_SIZE))
+        for log_entry in self._recent:
+            self._index(log_entry)
+    
+    def _writer_loop(self):
+        """Append queued entries to the actions log, one file write per batch; None stops the loop"""
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+            batch = [item]
+            while len(batch) < LOG_BATCH_SIZE:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
             
-            self.logger.info(f"Action logged: {action} by user {user_id}")
-        
-        except Exception as e:
-            self.logger.error(f"Error logging action: {e}")
+            try:
+                with self._file_lock, open(self.actions_log_file, 'ab', buffering=4096) as f:
+                    f.write(b''.join(batch))
+            except Exception as e:
+                self.logger.error(f"Error logging action: {e}")
+            finally:
+                for _ in range(len(batch) + stopping):
+                    self._queue.task_done()
+    
+    def flush(self):
+        """Block until every queued entry has been written"""
+        self._queue.join()
+    
+    def close(self):
+        """Write out queued entries and stop the writer thread; later entries are dropped"""
+        if not self._writer.is_alive():
+            return
+        self.enabled = False
+        self._queue.put(None)
+        self._writer.join()
+        atexit.unregister(self.flush)
     
     def get_recent_logs(self, limit=50):
         """Get recent log entries"""
+        with self._recent_lock:
+            if limit <= len(self._recent):
+                return list(islice(self._recent, len(self._recent) - limit, None))
+        
+        return self._read_logs(limit)
+    
+    def _read_logs(self, limit):
+        """Read the last 'limit' entries from the actions log file"""
         logs = []
         
         try:
-            with open(self.actions_log_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                
-                # Get the last 'limit' lines
-                recent_lines = lines[-limit:] if len(lines) > limit else lines
-                
-                for line in recent_lines:
-                    try:
-                        log_entry = json.loads(line.strip())
-                        logs.append(log_entry)
-                    except json.JSONDecodeError:
-                        continue
+            # Only the last 'limit' lines are read, not the whole file
+            for line in tail_lines(self.actions_log_file, limit):
+                try:
+                    log_entry = parse_log_entry(line)
+                    logs.append(log_entry)
+                except json.JSONDecodeError:
+                    continue
         
         except FileNotFoundError:
             self.logger.warning("Actions log file not found")
@@ -92,41 +233,46 @@ class BotLogger:
     
     def get_logs_by_action(self, action_type, limit=20):
         """Get logs filtered by action type"""
-        all_logs = self.get_recent_logs(limit=1000)
-        filtered_logs = [log for log in all_logs if log.get('action') == action_type]
-        return filtered_logs[-limit:] if len(filtered_logs) > limit else filtered_logs
+        with self._recent_lock:
+            return list(self._by_action.get(action_type, ()))[-limit:]
     
     def get_admin_actions(self, admin_id, limit=20):
         """Get actions performed by a specific admin"""
-        all_logs = self.get_recent_logs(limit=1000)
-        admin_logs = [log for log in all_logs if log.get('admin_id') == admin_id]
-        return admin_logs[-limit:] if len(admin_logs) > limit else admin_logs
+        with self._recent_lock:
+            return list(self._by_admin.get(admin_id, ()))[-limit:]
     
     def cleanup_old_logs(self, days_to_keep=30):
         """Clean up log entries older than specified days"""
-        from datetime import timedelta
+        cutoff_ts = time.time() - days_to_keep * 86400
         
-        cutoff_date = datetime.now() - timedelta(days=days_to_keep)
+        def is_recent(log):
+            try:
+                return log_entry_time(log) > cutoff_ts
+            except (KeyError, TypeError, ValueError):
+                return False
         
         try:
-            logs = self.get_recent_logs(limit=10000)  # Get more logs for cleanup
-            
-            # Filter logs newer than cutoff date
-            recent_logs = []
-            for log in logs:
-                try:
-                    log_date = datetime.fromisoformat(log['timestamp'])
-                    if log_date > cutoff_date:
-                        recent_logs.append(log)
-                except:
-                    continue
+            # Stream the file into a temp copy, keeping retained lines byte-for-byte;
+            # the writer thread waits on the lock, so no append is lost to the swap
+            temp_file = self.actions_log_file + '.tmp'
+            kept = 0
+            with self._file_lock:
+                with open(self.actions_log_file, 'rb') as src, open(temp_file, 'wb') as dst:
+                    for line in src:
+                        try:
+                            log = parse_log_entry(line)
+                        except ValueError:
+                            continue
+                        if is_recent(log):
+                            dst.write(line if line.endswith(b'\n') else line + b'\n')
+                            kept += 1
+                os.replace(temp_file, self.actions_log_file)
             
-            # Rewrite the file with only recent logs
-            with open(self.actions_log_file, 'w', encoding='utf-8') as f:
-                for log in recent_logs:
-                    f.write(json.dumps(log, ensure_ascii=False) + '\n')
+            with self._recent_lock:
+                self._recent = deque(filter(is_recent, self._recent), maxlen=RECENT_LOGS_SIZE)
+                self._rebuild_indexes()
             
-            self.logger.info(f"Cleaned up old logs, kept {len(recent_logs)} entries")
+            self.logger.info(f"Cleaned up old logs, kept {kept} entries")
         
         except Exception as e:
             self.logger.error(f"Error cleaning up logs: {e}")
@@ -5,16 +5,32 @@ Main entry point for the bot application
 """
 
 import os
+import sys
 import asyncio
 import logging
+import secrets
 import threading
-from flask import Flask, jsonify
-from telegram.ext import Application, CommandHandler, ChatMemberHandler, CallbackQueryHandler, MessageHandler, filters
-from bot_handler import BotHandler
+from flask import Flask, jsonify, request
+from telegram import Update
+from bot_handler import build_application, install_event_loop_policy
 from logger import setup_logging
 
+ALLOWED_UPDATES = ["message", "chat_member", "callback_query"]
+
+# With WEBHOOK_URL set (the public HTTPS base URL of this service), Telegram pushes
+# updates to WEBHOOK_PATH on the health server instead of the bot long-polling for them
+WEBHOOK_URL = os.environ.get("WEBHOOK_URL")
+WEBHOOK_PATH = "/webhook"
+WEBHOOK_SECRET = os.environ.get("WEBHOOK_SECRET") or secrets.token_urlsafe(32)
+
 # Flask app for health checks
 app = Flask(__name__)
+# Werkzeug logs one access line per request; probes hit the server constantly
+logging.getLogger('werkzeug').setLevel(logging.ERROR)
+
+webhook_target = None  # (application, event loop) once the bot accepts pushed updates
+webhook_stop = None  # event on the bot's loop; set it to stop serving the webhook
+bot_thread = None  # background thread running the bot beside the health server
 
 @app.route('/')
 def health_check():
@@ -30,15 +46,53 @@ def health():
     """Additional health endpoint"""
     return jsonify({"status": "ok"})
 
+@app.route(WEBHOOK_PATH, methods=['POST'])
+def telegram_webhook():
+    """Receive an update pushed by Telegram and queue it on the bot's event loop"""
+    if webhook_target is None:
+        return "", 503
+    if request.headers.get("X-Telegram-Bot-Api-Secret-Token") != WEBHOOK_SECRET:
+        return "", 403
+    application, loop = webhook_target
+    update = Update.de_json(request.get_json(force=True), application.bot)
+    # asyncio queues are not thread-safe, so the put runs on the bot's loop
+    loop.call_soon_threadsafe(application.update_queue.put_nowait, update)
+    return "", 200
+
+async def serve_webhook(application):
+    """Register the webhook and process pushed updates until webhook_stop is set"""
+    global webhook_target, webhook_stop
+    webhook_stop = asyncio.Event()
+    await application.initialize()
+    try:
+        await application.bot.set_webhook(
+            url=WEBHOOK_URL.rstrip("/") + WEBHOOK_PATH,
+            secret_token=WEBHOOK_SECRET,
+            allowed_updates=ALLOWED_UPDATES
+        )
+        # start() runs the update dispatcher; the application has no polling updater
+        await application.start()
+        webhook_target = (application, asyncio.get_running_loop())
+        await webhook_stop.wait()
+    finally:
+        # Same teardown as run_polling, so queued work and config writes are flushed
+        webhook_target = None
+        if application.running:
+            await application.stop()
+            if application.post_stop:
+                await application.post_stop(application)
+        await application.shutdown()
+        if application.post_shutdown:
+            await application.post_shutdown(application)
+
 def run_flask_server():
     """Run Flask server in a separate thread"""
     port = int(os.environ.get("PORT", 5000))
     # Ensure the server is accessible for deployment health checks
     app.run(host="0.0.0.0", port=port, debug=False, use_reloader=False, threaded=True)
 
-def main():
-    """Main function to start the bot and health check server"""
-    # Setup logging
+def create_application(polling=True):
+    """Set up logging and build the bot application with every handler registered; None without a token"""
     setup_logging()
     logger = logging.getLogger(__name__)
     
@@ -46,52 +100,67 @@ def main():
     bot_token = os.getenv("TELEGRAM_BOT_TOKEN")
     if not bot_token:
         logger.error("TELEGRAM_BOT_TOKEN environment variable is required")
-        return
-    
-    # Create application
-    application = Application.builder().token(bot_token).build()
-    
-    # Initialize bot handler
-    bot_handler = BotHandler()
-    
-    # Add command handlers
-    application.add_handler(CommandHandler("start", bot_handler.start_command))
-    application.add_handler(CommandHandler("help", bot_handler.help_command))
-    application.add_handler(CommandHandler("status", bot_handler.status_command))
-    application.add_handler(CommandHandler("logs", bot_handler.logs_command))
-    application.add_handler(CommandHandler("config", bot_handler.config_command))
-    application.add_handler(CommandHandler("add_admin", bot_handler.add_admin_command))
-    application.add_handler(CommandHandler("remove_admin", bot_handler.remove_admin_command))
-    application.add_handler(CommandHandler("list_admins", bot_handler.list_admins_command))
-    application.add_handler(CommandHandler("add_channel", bot_handler.add_channel_command))
-    
-    logger.info("Command handlers added: start, help, status, logs, config, add_admin, remove_admin, list_admins, add_channel")
+        return None
     
-    # Add callback query handler for inline buttons
-    application.add_handler(CallbackQueryHandler(bot_handler.button_callback))
-    
-    # Add message handler for text messages (for ID input)
-    application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, bot_handler.handle_text_message))
-    
-    # Add chat member handler to monitor admin changes
-    application.add_handler(ChatMemberHandler(bot_handler.chat_member_update, ChatMemberHandler.CHAT_MEMBER))
+    # The bot's event loop is created inside run_polling, so the policy must be set first
+    install_event_loop_policy()
     
+    application = build_application(bot_token, polling=polling)
     logger.info("Telegram bot is starting...")
+    return application
+
+def start_bot():
+    """Run the bot on a background thread beside the health server (also called from gunicorn.conf.py)"""
+    global bot_thread
+    use_webhook = bool(WEBHOOK_URL)
+    application = create_application(polling=not use_webhook)
+    if application is None:
+        return False
     
-    # Start bot in background thread to keep main thread for Flask
     def run_bot():
-        application.run_polling(allowed_updates=["message", "chat_member", "callback_query"])
+        if use_webhook:
+            asyncio.run(serve_webhook(application))
+        else:
+            application.run_polling(allowed_updates=ALLOWED_UPDATES)
     
     bot_thread = threading.Thread(target=run_bot, daemon=True)
     bot_thread.start()
+    return True
+
+def stop_bot():
+    """Let the webhook loop run its shutdown hooks before the daemon bot thread is killed"""
+    target = webhook_target
+    if target is not None:
+        target[1].call_soon_threadsafe(webhook_stop.set)
+        bot_thread.join(timeout=30)
+
+def main():
+    """Main function to start the bot and health check server"""
+    # Without the health server (ENABLE_HTTP=0) the bot simply polls in the main thread;
+    # webhooks are delivered through the health server, so this mode always polls
+    if os.environ.get("ENABLE_HTTP", "1") == "0":
+        application = create_application()
+        if application is not None:
+            application.run_polling(allowed_updates=ALLOWED_UPDATES)
+        return
+    
+    # Start bot in background thread to keep main thread for Flask
+    if not start_bot():
+        return
     
-    # Small delay for bot to initialize
-    import time
-    time.sleep(3)
-    logger.info("Bot started in background, starting HTTP server...")
+    # The application is already built, so the health server can start right away
+    logging.getLogger(__name__).info("Bot started in background, starting HTTP server...")
     
     # Start Flask server in main thread (required for workflow port detection)
-    run_flask_server()
+    try:
+        run_flask_server()
+    finally:
+        stop_bot()
 
 if __name__ == "__main__":
-    main()
+    if "--supervise" in sys.argv[1:]:
+        # Restart-on-failure mode, formerly started as a separate script
+        from keep_alive import main as supervise
+        supervise()
+    else:
+        main()
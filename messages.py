@@ -3,19 +3,61 @@ Messages Module
 Contains all bot messages with Arabic language support
 """
 
+import sys
+import time
+import string
+import functools
 from datetime import datetime
+from itertools import islice
 
-class Messages:
-    def __init__(self):
-        self.messages = {
-            'ar': {
-                'welcome': '''🛡️ مرحباً بك في بوت حماية القناة
+# Shared on/off labels; non-ASCII literals are not interned automatically
+ENABLED_LABEL = sys.intern('مفعل')
+DISABLED_LABEL = sys.intern('معطل')
+
+ACTION_TRANSLATIONS = {
+    'member_banned': 'تم حظر عضو',
+    'admin_banned_for_abuse': 'تم حظر مشرف لإساءة الاستخدام',
+    'start_command': 'تم تشغيل البوت',
+    'status_command': 'تم طلب الحالة',
+    'logs_command': 'تم طلب السجلات',
+    'config_command': 'تم طلب الإعدادات'
+}
+
+ADMIN_STATUS_LABELS = {
+    'administrator': 'مشرف',
+    'creator': 'منشئ القناة',
+    'unknown': 'غير معروف'
+}
+
+_timestamp_cache = (None, '')  # (epoch second, formatted text), replaced as a single tuple
+
+def current_timestamp():
+    """Return the current time as 'YYYY-MM-DD HH:MM:SS', formatting at most once per second"""
+    global _timestamp_cache
+    second = int(time.time())
+    cached_second, text = _timestamp_cache
+    if second != cached_second:
+        text = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(second))
+        _timestamp_cache = (second, text)
+    return text
+
+@functools.lru_cache(maxsize=256)
+def format_log_time(timestamp):
+    """Format an ISO log timestamp as 'MM-DD HH:MM'; the same tail entries are shown repeatedly"""
+    try:
+        return datetime.fromisoformat(timestamp).strftime('%m-%d %H:%M')
+    except (TypeError, ValueError):
+        return timestamp[:16]
+
+MESSAGES = {
+    'ar': {
+        'welcome': '''🛡️ مرحباً بك في بوت حماية القناة
 
 هذا البوت يقوم بمراقبة المشرفين ويمنع إساءة استخدام صلاحياتهم.
 
 استخدم الأزرار أدناه للبدء:''',
-                
-                'help': '''📋 بوت حماية القناة:
+        
+        'help': '''📋 بوت حماية القناة:
 
 🔧 الوظائف الأساسية:
 • إضافة قنوات للحماية
@@ -28,29 +70,29 @@ class Messages:
 1. اضغط "إضافة قناة للحماية" لحماية قناتك
 2. اضغط "إضافة مشرف للمراقبة" لمراقبة مشرف معين
 3. البوت سيراقب المشرفين تلقائياً ويمنع الإساءة''',
-                
-                'status_active': '''✅ حالة البوت: نشط
+        
+        'status_active': '''✅ حالة البوت: نشط
 
 📊 الإحصائيات:
 • القنوات المحمية: {protected_channels}
 • المشرفين المراقبين: {monitored_admins}
-• الحظر التلقائي: {'مفعل' if '{auto_ban_enabled}' else 'معطل'}
+• الحظر التلقائي: {auto_ban_enabled}
 
 🕐 آخر تحديث: {timestamp}''',
-                
-                'unauthorized': '❌ غير مسموح لك باستخدام هذا الأمر',
-                
-                'admin_banned': '''⚠️ تم إزالة مشرف من القناة
+        
+        'unauthorized': '❌ غير مسموح لك باستخدام هذا الأمر',
+        
+        'admin_banned': '''⚠️ تم إزالة مشرف من القناة
 
 👤 المشرف المحظور: @{admin_username}
 📝 السبب: حظر العضو @{banned_user}
 🕐 التوقيت: {timestamp}
 
 تم حظر المشرف تلقائياً لإساءة استخدام الصلاحيات''',
-                
-                'logs_header': '📋 آخر الأحداث المسجلة:\n\n',
-                
-                'config_display': '''⚙️ إعدادات البوت:
+        
+        'logs_header': '📋 آخر الأحداث المسجلة:\n\n',
+        
+        'config_display': '''⚙️ إعدادات البوت:
 
 🌐 اللغة: العربية
 🔄 الحظر التلقائي: {auto_ban_status}
@@ -59,26 +101,26 @@ class Messages:
 
 📁 القنوات المحمية: {protected_count}
 👥 المشرفين المراقبين: {monitored_count}''',
-                
-                'no_logs': 'لا توجد سجلات متاحة',
-                
-                'action_member_banned': 'تم حظر عضو',
-                'action_admin_banned': 'تم حظر مشرف',
-                'action_start_command': 'تم تشغيل البوت',
-                
-                'only_creator_allowed': '❌ هذا الأمر متاح فقط لمالك القناة',
-                'add_admin_usage': '📝 الاستخدام: /add_admin [ID_المشرف]\n\nمثال:\n/add_admin 123456789\n\n📋 طريقة الحصول على ID المشرف:\n• استخدم البوت @GetChatID_IL_BOT للحصول على ID بسهولة\n• أو أرسل رسالة من المشرف واضغط "إعادة توجيه"',
-                'remove_admin_usage': '📝 الاستخدام: /remove_admin [رقم_المشرف]\nمثال: /remove_admin 123456789',
-                'invalid_user_id': '❌ رقم المستخدم غير صحيح',
-                'admin_added_success': '✅ تم إضافة المشرف {admin_id} إلى قائمة المراقبة',
-                'admin_add_failed': '❌ فشل في إضافة المشرف (تأكد من أنه مشرف فعلاً)',
-                'admin_removed_success': '✅ تم إزالة المشرف {admin_id} من قائمة المراقبة',
-                'admin_not_monitored': '❌ هذا المشرف غير موجود في قائمة المراقبة',
-                'no_monitored_admins': '📝 لا يوجد مشرفين مراقبين حالياً',
-                
-                'monitored_admins_header': '👥 المشرفين المراقبين:\n\n',
-                
-                'add_channel_instructions': '''🛡️ إضافة قناة للحماية
+        
+        'no_logs': 'لا توجد سجلات متاحة',
+        
+        'action_member_banned': 'تم حظر عضو',
+        'action_admin_banned': 'تم حظر مشرف',
+        'action_start_command': 'تم تشغيل البوت',
+        
+        'only_creator_allowed': '❌ هذا الأمر متاح فقط لمالك القناة',
+        'add_admin_usage': '📝 الاستخدام: /add_admin [ID_المشرف]\n\nمثال:\n/add_admin 123456789\n\n📋 طريقة الحصول على ID المشرف:\n• استخدم البوت @GetChatID_IL_BOT للحصول على ID بسهولة\n• أو أرسل رسالة من المشرف واضغط "إعادة توجيه"',
+        'remove_admin_usage': '📝 الاستخدام: /remove_admin [رقم_المشرف]\nمثال: /remove_admin 123456789',
+        'invalid_user_id': '❌ رقم المستخدم غير صحيح',
+        'admin_added_success': '✅ تم إضافة المشرف {admin_id} إلى قائمة المراقبة',
+        'admin_add_failed': '❌ فشل في إضافة المشرف (تأكد من أنه مشرف فعلاً)',
+        'admin_removed_success': '✅ تم إزالة المشرف {admin_id} من قائمة المراقبة',
+        'admin_not_monitored': '❌ هذا المشرف غير موجود في قائمة المراقبة',
+        'no_monitored_admins': '📝 لا يوجد مشرفين مراقبين حالياً',
+        
+        'monitored_admins_header': '👥 المشرفين المراقبين:\n\n',
+        
+        'add_channel_instructions': '''🛡️ إضافة قناة للحماية
 
 أرسل ID القناة التي تريد حمايتها باستخدام الأمر:
 /add_channel [ID_القناة]
@@ -95,7 +137,7 @@ class Messages:
 • يجب إضافة البوت كمشرف في القناة
 • يجب منح البوت صلاحيات "حظر الأعضاء" و "إدارة المشرفين"''',
 
-                'add_admin_instructions': '''👤 إضافة مشرف للمراقبة
+        'add_admin_instructions': '''👤 إضافة مشرف للمراقبة
 
 أرسل ID المشرف الذي تريد مراقبته باستخدام الأمر:
 /add_admin [ID_المشرف]
@@ -111,38 +153,70 @@ class Messages:
 • البوت سيضيف المستخدم للمراقبة ويحاول ترقيته لمشرف تلقائياً
 • يجب أن يكون ID صحيح وفعال''',
 
-                'channel_added_success': '✅ تم إضافة القناة إلى قائمة الحماية بنجاح!\n\nالبوت الآن سيراقب أنشطة المشرفين المحددين في هذه القناة.',
-                
-                'channel_already_protected': '⚠️ هذه القناة محمية بالفعل!'
-            }
-        }
+        'channel_added_success': '✅ تم إضافة القناة إلى قائمة الحماية بنجاح!\n\nالبوت الآن سيراقب أنشطة المشرفين المحددين في هذه القناة.',
+        
+        'channel_already_protected': '⚠️ هذه القناة محمية بالفعل!'
+    }
+}
+
+NO_MESSAGES = {}  # stand-in catalogue for unknown languages
+
+def compile_templates(catalogues):
+    """Parse every template once into (literal, field_name) pairs so formatting is a join"""
+    compiled = {}
+    for language, catalogue in catalogues.items():
+        for key, template in catalogue.items():
+            try:
+                parts = list(string.Formatter().parse(template))
+            except ValueError:
+                continue  # not a valid format string; get_message falls back to str.format
+            if any(spec or conversion for _, _, spec, conversion in parts):
+                continue
+            compiled[(language, key)] = tuple((literal, field) for literal, field, _, _ in parts)
+    return compiled
+
+class Messages:
+    # The catalogue is immutable, so it is built and parsed once at import rather than per instance
+    messages = MESSAGES
+    _compiled = compile_templates(MESSAGES)
     
     def get_message(self, message_key, language='ar', **kwargs):
         """Get a message in the specified language"""
+        message = self.messages.get(language, NO_MESSAGES).get(message_key)
+        if message is None:
+            return f"Message not found: {message_key}"
+        if not kwargs:
+            return message
         try:
-            message = self.messages[language][message_key]
-            if kwargs:
+            parts = self._compiled.get((language, message_key))
+            if parts is None:
                 return message.format(**kwargs)
-            return message
+            return ''.join(
+                literal if field is None else literal + str(kwargs[field])
+                for literal, field in parts
+            )
         except KeyError:
+            # A placeholder without a matching argument
             return f"Message not found: {message_key}"
     
     def get_status_message(self, status_info, language='ar'):
         """Generate status message"""
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        timestamp = current_timestamp()
         
-        return self.get_message('status_active', language).format(
+        return self.get_message(
+            'status_active', language,
             protected_channels=status_info['protected_channels'],
             monitored_admins=status_info['monitored_admins'],
-            auto_ban_enabled='مفعل' if status_info['auto_ban_enabled'] else 'معطل',
+            auto_ban_enabled=ENABLED_LABEL if status_info['auto_ban_enabled'] else DISABLED_LABEL,
             timestamp=timestamp
         )
     
     def get_admin_banned_message(self, admin_username, banned_username, language='ar'):
         """Generate admin banned notification message"""
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        timestamp = current_timestamp()
         
-        return self.get_message('admin_banned', language).format(
+        return self.get_message(
+            'admin_banned', language,
             admin_username=admin_username,
             banned_user=banned_username,
             timestamp=timestamp
@@ -153,40 +227,42 @@ class Messages:
         if not logs:
             return self.get_message('no_logs', language)
         
-        message = self.get_message('logs_header', language)
+        parts = [self.get_message('logs_header', language)]
+        translate = ACTION_TRANSLATIONS.get
         
-        for log in logs[-10:]:  # Show last 10 logs
+        for log in islice(logs, max(0, len(logs) - 10), None):  # Show last 10 logs
             timestamp = log.get('timestamp', '')
             action = log.get('action', '')
             user_id = log.get('user_id', '')
             admin_id = log.get('admin_id', '')
             
-            # Format timestamp
-            try:
-                dt = datetime.fromisoformat(timestamp)
-                formatted_time = dt.strftime('%m-%d %H:%M')
-            except:
-                formatted_time = timestamp[:16]
+            # Format timestamp; entries carrying epoch seconds skip the ISO parse
+            ts = log.get('ts')
+            if ts is not None:
+                formatted_time = time.strftime('%m-%d %H:%M', time.localtime(ts))
+            else:
+                formatted_time = format_log_time(timestamp)
             
             # Translate action
-            action_text = self._translate_action(action, language)
+            action_text = translate(action, action)
             
             if admin_id and user_id != admin_id:
-                message += f"🕐 {formatted_time} - {action_text} (Admin: {admin_id}, User: {user_id})\n"
+                parts.append(f"🕐 {formatted_time} - {action_text} (Admin: {admin_id}, User: {user_id})\n")
             else:
-                message += f"🕐 {formatted_time} - {action_text} (User: {user_id})\n"
+                parts.append(f"🕐 {formatted_time} - {action_text} (User: {user_id})\n")
         
-        return message
+        return ''.join(parts)
     
     def get_config_message(self, config, language='ar'):
         """Generate configuration display message"""
-        auto_ban_status = 'مفعل' if config['channel_settings']['auto_ban_enabled'] else 'معطل'
-        notifications_status = 'مفعل' if config['channel_settings'].get('notification_enabled', True) else 'معطل'
+        auto_ban_status = ENABLED_LABEL if config['channel_settings']['auto_ban_enabled'] else DISABLED_LABEL
+        notifications_status = ENABLED_LABEL if config['channel_settings'].get('notification_enabled', True) else DISABLED_LABEL
         api_limit = config['rate_limits'].get('api_calls_per_minute', 30)
         protected_count = len(config['channel_settings']['protected_channels'])
         monitored_count = len(config['channel_settings']['monitored_admins'])
         
-        return self.get_message('config_display', language).format(
+        return self.get_message(
+            'config_display', language,
             auto_ban_status=auto_ban_status,
             notifications_status=notifications_status,
             api_limit=api_limit,
@@ -194,22 +270,9 @@ class Messages:
             monitored_count=monitored_count
         )
     
-    def _translate_action(self, action, language='ar'):
-        """Translate action names to Arabic"""
-        action_translations = {
-            'member_banned': 'تم حظر عضو',
-            'admin_banned_for_abuse': 'تم حظر مشرف لإساءة الاستخدام',
-            'start_command': 'تم تشغيل البوت',
-            'status_command': 'تم طلب الحالة',
-            'logs_command': 'تم طلب السجلات',
-            'config_command': 'تم طلب الإعدادات'
-        }
-        
-        return action_translations.get(action, action)
-    
     def get_monitored_admins_message(self, admin_details, language='ar'):
         """Generate message showing monitored admins"""
-        message = self.get_message('monitored_admins_header', language)
+        parts = [self.get_message('monitored_admins_header', language)]
         
         for i, admin in enumerate(admin_details, 1):
             admin_id = admin.get('id', 'N/A')
@@ -217,16 +280,14 @@ class Messages:
             first_name = admin.get('first_name', 'Unknown')
             status = admin.get('status', 'unknown')
             
-            status_text = {
-                'administrator': 'مشرف',
-                'creator': 'منشئ القناة',
-                'unknown': 'غير معروف'
-            }.get(status, status)
+            status_text = ADMIN_STATUS_LABELS.get(status, status)
             
             username_text = f"@{username}" if username else "لا يوجد"
             
-            message += f"{i}. {first_name} ({admin_id})\n"
-            message += f"   🔗 المعرف: {username_text}\n"
-            message += f"   👤 الحالة: {status_text}\n\n"
+            parts.append(
+                f"{i}. {first_name} ({admin_id})\n"
+                f"   🔗 المعرف: {username_text}\n"
+                f"   👤 الحالة: {status_text}\n\n"
+            )
         
-        return message
+        return ''.join(parts)
@@ -10,8 +10,7 @@ import sys
 # Ensure the current directory is in the Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-# Import and run the main application
-from main import main
-
 if __name__ == "__main__":
+    # Imported here so importing this module does not pull in telegram and flask
+    from main import main
     main()
\ No newline at end of file
@@ -1,22 +1,25 @@
 import os
-from telegram.ext import Application, CommandHandler
 
 # جلب التوكن من المتغيرات البيئية
 TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
 
-async def start(update, context):
-    await update.message.reply_text("✅ البوت شغال على Railway!")
-
 def main():
     if not TOKEN:
         print("❌ Error: TELEGRAM_BOT_TOKEN not found in environment variables")
         return
 
-    app = Application.builder().token(TOKEN).build()
-    app.add_handler(CommandHandler("start", start))
+    # The telegram stack is only imported once there is a token to run with
+    from bot_handler import build_application
+    from logger import setup_logging
+
+    setup_logging()
+    app = build_application(TOKEN)
 
     print("🚀 Bot is running...")
-    app.run_polling()
+    app.run_polling(allowed_updates=["message", "chat_member", "callback_query"])
 
 if __name__ == "__main__":
+    # keep_alive sets up its own loop per run, so the policy is only installed when run directly
+    from bot_handler import install_event_loop_policy
+    install_event_loop_policy()
     main()
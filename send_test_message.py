@@ -11,22 +11,7 @@ from telegram import Bot
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-async def send_test():
-    """Send test message to check bot functionality"""
-    
-    token = os.getenv("TELEGRAM_BOT_TOKEN")
-    if not token:
-        logger.error("No TELEGRAM_BOT_TOKEN found")
-        return
-    
-    # Your user ID (from the logs I saw earlier: 6854864464)
-    test_user_id = 6854864464
-    
-    try:
-        bot = Bot(token=token)
-        
-        # Send test message
-        message = """🤖 اختبار البوت
+TEST_MESSAGE = """🤖 اختبار البوت
 
 البوت يعمل بشكل صحيح!
 
@@ -38,15 +23,35 @@ async def send_test():
 
 البوت جاهز للاستخدام! ✅"""
 
-        logger.info(f"Sending test message to user {test_user_id}")
-        
-        await bot.send_message(
-            chat_id=test_user_id,
-            text=message
+async def send_messages(token, batch):
+    """Send (chat_id, text) pairs over one Bot so every request shares its connection pool"""
+    async with Bot(token=token) as bot:
+        results = await asyncio.gather(
+            *(bot.send_message(chat_id=chat_id, text=text) for chat_id, text in batch),
+            return_exceptions=True
         )
-        
-        logger.info("✅ Test message sent successfully!")
-        
+    for (chat_id, _), result in zip(batch, results):
+        if isinstance(result, Exception):
+            logger.error(f"❌ Failed to send test message to {chat_id}: {result}")
+        else:
+            logger.info(f"✅ Test message sent successfully to {chat_id}!")
+    return results
+
+async def send_test():
+    """Send test message to check bot functionality"""
+    
+    token = os.getenv("TELEGRAM_BOT_TOKEN")
+    if not token:
+        logger.error("No TELEGRAM_BOT_TOKEN found")
+        return
+    
+    # Your user ID (from the logs I saw earlier: 6854864464)
+    test_user_id = 6854864464
+    
+    logger.info(f"Sending test message to user {test_user_id}")
+    
+    try:
+        await send_messages(token, [(test_user_id, TEST_MESSAGE)])
     except Exception as e:
         logger.error(f"❌ Failed to send test message: {e}")
 
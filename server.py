@@ -5,110 +5,117 @@ Starts Flask HTTP server as primary process with Telegram bot in background
 """
 
 import os
-import asyncio
+import sys
 import logging
 import threading
-import time
-import atexit
-from flask import Flask, jsonify
-from telegram.ext import Application, CommandHandler, ChatMemberHandler, CallbackQueryHandler, MessageHandler, filters
-from bot_handler import BotHandler
+import fcntl
+from flask import Flask, request
 from logger import setup_logging
+from affinity import pin_process_cpu
+from http_json import encode_json, json_response
+
+try:
+    from waitress import serve as waitress_serve
+except ImportError:
+    waitress_serve = None
+
+HTTP_THREADS = 4  # waitress worker threads; probes are tiny, so a few are plenty
+DEFAULT_PORT = 5000  # used when PORT is not set
 
 # Flask app for health checks
 app = Flask(__name__)
+# Werkzeug logs one access line per request; probes hit the server constantly
+logging.getLogger('werkzeug').setLevel(logging.ERROR)
 
 # Global bot application
 bot_application = None
 bot_lock_file = "/tmp/telegram_bot.lock"
+bot_lock_fd = None
+bot_ready = threading.Event()  # set once the bot application is built or startup has given up
+bot_enabled = True  # False when serving HTTP only (--http-only)
 
-def create_lock_file():
-    """Create a lock file to prevent multiple instances"""
+def acquire_instance_lock():
+    """Take an exclusive lock on the lock file; the kernel releases it when this process exits"""
+    global bot_lock_fd
+    fd = os.open(bot_lock_file, os.O_CREAT | os.O_RDWR, 0o644)
     try:
-        with open(bot_lock_file, 'w') as f:
-            f.write(str(os.getpid()))
-        atexit.register(remove_lock_file)
-        return True
-    except:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        os.close(fd)
         return False
+    # Record the holder's PID for anyone inspecting the file; the lock itself is the flock
+    os.ftruncate(fd, 0)
+    os.write(fd, str(os.getpid()).encode())
+    bot_lock_fd = fd  # kept open for the life of the process
+    return True
 
-def remove_lock_file():
-    """Remove the lock file"""
-    try:
-        if os.path.exists(bot_lock_file):
-            os.remove(bot_lock_file)
-    except:
-        pass
-
-def is_another_instance_running():
-    """Check if another instance is running"""
-    if not os.path.exists(bot_lock_file):
-        return False
-    try:
-        with open(bot_lock_file, 'r') as f:
-            pid = int(f.read().strip())
-        # Check if process is still running
-        os.kill(pid, 0)
-        return True
-    except (OSError, ValueError):
-        # Process doesn't exist, remove stale lock file
-        remove_lock_file()
-        return False
-
-@app.route('/')
-def health_check():
-    """Primary health check endpoint for deployment"""
-    try:
-        global bot_application
-        bot_running = bot_application is not None
-        return jsonify({
+def encode_health_bodies(port):
+    """Encode the / body for both bot states; nothing else in it changes after startup"""
+    return {
+        running: encode_json(app, {
             "status": "healthy",
             "service": "telegram-bot",
             "message": "Bot is running",
-            "bot_initialized": bot_running,
+            "bot_initialized": running,
             "timestamp": os.environ.get("REPL_ID", "local"),
-            "port": os.environ.get("PORT", "5000")
-        }), 200
-    except Exception as e:
-        return jsonify({
-            "status": "error", 
-            "message": str(e)
-        }), 500
-
-@app.route('/health')
-def health():
-    """Simplified health endpoint"""
-    return jsonify({"status": "ok"}), 200
-
-@app.route('/bot-status')
-def bot_status():
-    """Detailed bot status endpoint"""
-    global bot_application
-    try:
-        if bot_application:
-            return jsonify({
-                "status": "active",
-                "bot": "running", 
-                "handlers": "loaded",
-                "application_running": True
-            }), 200
-        return jsonify({
-            "status": "starting",
-            "bot": "initializing",
-            "application_running": False
-        }), 200
-    except Exception as e:
-        return jsonify({
-            "status": "error",
-            "message": str(e)
-        }), 500
+            "port": str(port)
+        })
+        for running in (False, True)
+    }
+
+# Every probe body is fixed at startup apart from whether the bot application exists yet
+health_bodies = encode_health_bodies(DEFAULT_PORT)  # re-encoded by main() for the configured port
+HEALTH_OK_BODY = encode_json(app, {"status": "ok"})
+BOT_STATUS_ACTIVE_BODY = encode_json(app, {
+    "status": "active",
+    "bot": "running",
+    "handlers": "loaded",
+    "application_running": True
+})
+BOT_STATUS_STARTING_BODY = encode_json(app, {
+    "status": "starting",
+    "bot": "initializing",
+    "application_running": False
+})
+BOT_STATUS_DISABLED_BODY = encode_json(app, {
+    "status": "http-only",
+    "bot": "disabled",
+    "application_running": False
+})
+
+probe_bodies = {}  # path -> encoded body; replaced whole, never mutated in place
+
+def rebuild_probe_bodies():
+    """Select the probe bodies for the current bot state (call after bot_application changes)"""
+    global probe_bodies
+    running = bot_application is not None
+    if not bot_enabled:
+        bot_status_body = BOT_STATUS_DISABLED_BODY
+    elif running:
+        bot_status_body = BOT_STATUS_ACTIVE_BODY
+    else:
+        bot_status_body = BOT_STATUS_STARTING_BODY
+    probe_bodies = {
+        '/': health_bodies[running],
+        '/health': HEALTH_OK_BODY,
+        '/bot-status': bot_status_body
+    }
+
+rebuild_probe_bodies()
+
+def probe():
+    """Health and status endpoints: one lookup into the precomputed bodies"""
+    return json_response(probe_bodies[request.path])
+
+for endpoint, path in (('health_check', '/'), ('health', '/health'), ('bot_status', '/bot-status')):
+    app.add_url_rule(path, endpoint, probe)
 
 @app.route('/ping')
 def ping():
     """Simple ping endpoint for basic connectivity test"""
     return "pong", 200
 
-def setup_telegram_bot():
+def setup_telegram_bot(bot_token):
     """Setup and start Telegram bot in main thread"""
     global bot_application
     
@@ -116,51 +123,22 @@ def setup_telegram_bot():
     setup_logging()
     logger = logging.getLogger(__name__)
     
-    # Check if another instance is running
-    if is_another_instance_running():
+    # Only one instance may poll with this token
+    if not acquire_instance_lock():
         logger.warning("Another bot instance is already running. Skipping bot startup.")
+        bot_ready.set()
         return
     
-    # Create lock file
-    if not create_lock_file():
-        logger.error("Failed to create lock file. Another instance may be running.")
-        return
-    
-    # Get bot token from environment
-    bot_token = os.getenv("TELEGRAM_BOT_TOKEN")
-    if not bot_token:
-        logger.error("TELEGRAM_BOT_TOKEN environment variable is required")
-        return
-    
-    # Create application with improved configuration for conflict resolution
-    bot_application = Application.builder().token(bot_token).build()
-    
-    # Note: Webhook clearing will be handled by run_polling automatically
-    
-    # Initialize bot handler
-    bot_handler = BotHandler()
+    # The telegram stack is imported only in the bot thread, after the cheap checks above
+    from bot_handler import build_application, install_event_loop_policy
     
-    # Add command handlers
-    bot_application.add_handler(CommandHandler("start", bot_handler.start_command))
-    bot_application.add_handler(CommandHandler("help", bot_handler.help_command))
-    bot_application.add_handler(CommandHandler("status", bot_handler.status_command))
-    bot_application.add_handler(CommandHandler("logs", bot_handler.logs_command))
-    bot_application.add_handler(CommandHandler("config", bot_handler.config_command))
-    bot_application.add_handler(CommandHandler("add_admin", bot_handler.add_admin_command))
-    bot_application.add_handler(CommandHandler("remove_admin", bot_handler.remove_admin_command))
-    bot_application.add_handler(CommandHandler("list_admins", bot_handler.list_admins_command))
-    bot_application.add_handler(CommandHandler("add_channel", bot_handler.add_channel_command))
+    # The bot's event loop is created inside run_polling, so the policy must be set first
+    install_event_loop_policy()
     
-    logger.info("Command handlers added: start, help, status, logs, config, add_admin, remove_admin, list_admins, add_channel")
-    
-    # Add callback query handler for inline buttons
-    bot_application.add_handler(CallbackQueryHandler(bot_handler.button_callback))
-    
-    # Add message handler for text messages (for ID input)
-    bot_application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, bot_handler.handle_text_message))
-    
-    # Add chat member handler to monitor admin changes
-    bot_application.add_handler(ChatMemberHandler(bot_handler.chat_member_update, ChatMemberHandler.CHAT_MEMBER))
+    # Create application with every handler registered (same table as main.py)
+    bot_application = build_application(bot_token)
+    rebuild_probe_bodies()
+    bot_ready.set()
     
     logger.info("Telegram bot is starting...")
     
@@ -181,31 +159,49 @@ def setup_telegram_bot():
             logger.error(f"Unexpected bot error: {error_msg}")
             raise
 
-def start_flask_server():
+def start_flask_server(port):
     """Start Flask server in main thread"""
-    port = int(os.environ.get("PORT", 5000))
     print(f"Starting HTTP server on 0.0.0.0:{port}")
+    if waitress_serve is not None:
+        # Production WSGI server with a fixed thread pool instead of a thread per request
+        waitress_serve(app, host="0.0.0.0", port=port, threads=HTTP_THREADS)
+        return
     app.run(host="0.0.0.0", port=port, debug=False, use_reloader=False, threaded=True)
 
-def main():
+def main(http_only=False):
     """Main function - starts Telegram bot in background and Flask server as main process"""
-    # Start Telegram bot in background thread
-    bot_thread = threading.Thread(target=setup_telegram_bot, daemon=False)
-    bot_thread.start()
-    
-    # Give bot a moment to start
-    import time
-    time.sleep(3)
+    global bot_enabled, health_bodies
+    # Read the environment once here; everything below is handed these values
+    port = int(os.environ.get("PORT", DEFAULT_PORT))
+    bot_token = os.getenv("TELEGRAM_BOT_TOKEN")
+    if not http_only and not bot_token:
+        print("TELEGRAM_BOT_TOKEN environment variable is required")
+        sys.exit(1)
+    
+    # Before the bot thread starts, so its own rebuild can't be overwritten with a stale state
+    bot_enabled = not http_only
+    health_bodies = encode_health_bodies(port)
+    rebuild_probe_bodies()
+    
+    if not http_only:
+        # Threads started below inherit the CPU mask
+        pin_process_cpu()
+        
+        # Start Telegram bot in background thread
+        bot_thread = threading.Thread(target=setup_telegram_bot, args=(bot_token,), daemon=False)
+        bot_thread.start()
+        
+        # Wait until the bot is built (or has given up) instead of sleeping a fixed time
+        bot_ready.wait(timeout=10)
     
     # Start Flask server in main thread - this ensures port is properly bound
     try:
-        start_flask_server()
+        start_flask_server(port)
     except KeyboardInterrupt:
         print("Server stopped by user")
     except Exception as e:
         print(f"Server error: {e}")
-    finally:
-        remove_lock_file()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # --http-only serves the health endpoints without starting the bot
+    main(http_only="--http-only" in sys.argv[1:])
\ No newline at end of file
@@ -20,11 +20,11 @@ async def test_bot():
         return
     
     try:
-        bot = Bot(token=token)
-        
-        # Test bot connection
-        logger.info("Testing bot connection...")
-        me = await bot.get_me()
+        # One session for both calls, so they share the connection pool
+        async with Bot(token=token) as bot:
+            # The connection check and the update fetch are independent, so run them together
+            logger.info("Testing bot connection and checking for recent updates...")
+            me, updates = await asyncio.gather(bot.get_me(), bot.get_updates(limit=5))
         logger.info(f"Bot connected: @{me.username} ({me.first_name})")
         
         # Test bot status
@@ -34,9 +34,6 @@ async def test_bot():
         logger.info(f"- Name: {me.first_name}")
         logger.info(f"- Can read messages: {not me.can_read_all_group_messages}")
         
-        # Get updates to see if bot is receiving messages
-        logger.info("Checking for recent updates...")
-        updates = await bot.get_updates(limit=5)
         logger.info(f"Recent updates count: {len(updates)}")
         
         if updates: